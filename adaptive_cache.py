@@ -0,0 +1,161 @@
+"""
+비용 인식 적응형 캐시
+모든 결과를 고정 5분 TTL로 저장하는 대신, 측정된 실행 시간(비용)과 접근 빈도로 저장 여부와 TTL을 정합니다.
+- TinyLFU 방식 승인: count-min 스케치로 접근 빈도를 추정하고, 캐시가 가득 차면
+  (빈도 × 비용)이 LRU 희생 항목보다 클 때만 교체
+- TTL: 평균보다 비싼 질의, 자주 찾는 질의일수록 길게 (min_ttl ~ max_ttl)
+"""
+
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+COUNTER_MAX = 15  # TinyLFU의 4비트 카운터 상한
+
+
+class FrequencySketch:
+    """count-min 스케치 (sample_size번 기록마다 모든 카운터를 절반으로 줄여 오래된 빈도를 잊음)"""
+
+    def __init__(self, width: int, depth: int = 4, sample_size: Optional[int] = None):
+        self.width = max(16, 1 << (width - 1).bit_length())
+        self.depth = depth
+        self.sample_size = sample_size or 10 * width
+        self._rows: List[List[int]] = [[0] * self.width for _ in range(depth)]
+        self._seeds = [random.getrandbits(32) for _ in range(depth)]
+        self._additions = 0
+
+    def _indexes(self, key: Hashable):
+        mask = self.width - 1
+        return [hash((seed, key)) & mask for seed in self._seeds]
+
+    def increment(self, key: Hashable) -> None:
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < COUNTER_MAX:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._reset()
+
+    def estimate(self, key: Hashable) -> int:
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _reset(self) -> None:
+        for row in self._rows:
+            for i, count in enumerate(row):
+                row[i] = count >> 1
+        self._additions //= 2
+
+
+class CacheEntry:
+    __slots__ = ("value", "cost", "stored_at", "expires_at", "hits")
+
+    def __init__(self, value: Any, cost: float, stored_at: float, expires_at: float):
+        self.value = value
+        self.cost = cost
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.hits = 0
+
+
+class AdaptiveCache:
+    """TinyLFU 승인 + 비용/빈도 기반 TTL을 적용한 LRU 캐시"""
+
+    def __init__(self, max_entries: int = 128, base_ttl: float = 300.0,
+                 min_ttl: float = 30.0, max_ttl: float = 3600.0):
+        """base_ttl: 평균 비용 질의를 처음 저장할 때의 TTL"""
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.base_ttl = base_ttl
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self.sketch = FrequencySketch(max_entries * 8)
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._mean_cost: Optional[float] = None  # 저장 시도된 결과의 실행 시간 이동 평균
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry.expires_at > time.time()
+
+    def ttl_for(self, cost: float, frequency: int) -> float:
+        """평균 대비 비용의 제곱근과 빈도의 로그에 비례하는 TTL"""
+        mean = self._mean_cost or cost
+        cost_factor = math.sqrt(cost / mean) if mean > 0 else 1.0
+        frequency_factor = math.log2(1 + max(1, frequency))
+        ttl = self.base_ttl * min(4.0, max(0.25, cost_factor)) * frequency_factor
+        return min(self.max_ttl, max(self.min_ttl, ttl))
+
+    def get(self, key: Hashable, now: Optional[float] = None) -> Optional[Any]:
+        """조회 (적중 여부와 관계없이 빈도 기록). 없거나 만료되면 None"""
+        now = time.time() if now is None else now
+        with self._lock:
+            self.sketch.increment(key)
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            entry.hits += 1
+            # 자주 찾을수록 만료 시점 연장
+            entry.expires_at = max(entry.expires_at,
+                                   entry.stored_at + self.ttl_for(entry.cost, self.sketch.estimate(key)))
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, key: Hashable, value: Any, cost: float, now: Optional[float] = None) -> bool:
+        """
+        결과 저장 시도. cost는 결과를 만드는 데 걸린 실행 시간(초)
+        캐시가 가득 차 있고 희생 항목보다 가치(빈도 × 비용)가 낮으면 저장하지 않고 False
+        """
+        now = time.time() if now is None else now
+        cost = max(cost, 1e-6)
+        with self._lock:
+            self._mean_cost = cost if self._mean_cost is None else 0.9 * self._mean_cost + 0.1 * cost
+            frequency = self.sketch.estimate(key)
+
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                victim_key, victim = next(iter(self._entries.items()))
+                if victim.expires_at > now:
+                    victim_value = self.sketch.estimate(victim_key) * victim.cost
+                    if frequency * cost <= victim_value:
+                        self.rejected += 1
+                        return False
+                del self._entries[victim_key]
+                self.evictions += 1
+
+            self._entries[key] = CacheEntry(value, cost, now, now + self.ttl_for(cost, frequency))
+            self._entries.move_to_end(key)
+            self.admitted += 1
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+            "mean_cost": self._mean_cost,
+        }
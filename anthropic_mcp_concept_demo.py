@@ -14,14 +14,19 @@ import json
 import hashlib
 import time
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any
+
+from adaptive_cache import AdaptiveCache
+from real_mcp_server_example import SimpleFileMCPServer
+from workspace_catalog import WorkspaceCatalog
 
 class AnthropicMCPConceptDemo:
     """Anthropic MCP 개념 실제 데모"""
     
     def __init__(self, work_dir: str):
         self.work_dir = Path(work_dir)
-        self.state_cache = {}  # MCP의 핵심: 상태 저장
+        self.catalog = WorkspaceCatalog(self.work_dir)
+        self.state_cache = AdaptiveCache(max_entries=64)  # MCP의 핵심: 상태 저장 (비용/빈도 기반 TTL)
         self.execution_history = []  # 실행 기록
         
     async def demonstrate_progressive_disclosure(self):
@@ -167,7 +172,7 @@ class AnthropicMCPConceptDemo:
             doc_ids = metadata_response["document_ids"]
             filtered_response = await self._call_tool("get_documents", {
                 "document_ids": doc_ids,
-                "fields": ["title", "summary"]  # 필요한 필드만
+                "fields": ["title", "preview"]  # 필요한 필드만
             })
             
             context_size_new = len(json.dumps(filtered_response))
@@ -183,31 +188,8 @@ class AnthropicMCPConceptDemo:
             print(f"   🎯 목표 달성: 관련 정보만 정확히 전달")
         
     async def _get_tools_list(self) -> Dict[str, Any]:
-        """도구 목록 조회 (MCP 표준)"""
-        return {
-            "tools": [
-                {
-                    "name": "search_files",
-                    "description": "파일 검색",
-                    "inputSchema": {"type": "object", "properties": {"query": {"type": "string"}}}
-                },
-                {
-                    "name": "read_file", 
-                    "description": "파일 읽기",
-                    "inputSchema": {"type": "object", "properties": {"path": {"type": "string"}}}
-                },
-                {
-                    "name": "get_metadata",
-                    "description": "문서 메타데이터 조회",
-                    "inputSchema": {"type": "object", "properties": {"category": {"type": "string"}}}
-                },
-                {
-                    "name": "get_documents",
-                    "description": "특정 문서 조회",
-                    "inputSchema": {"type": "object", "properties": {"document_ids": {"type": "array"}}}
-                }
-            ]
-        }
+        """도구 목록 조회 (MCP 표준) - 서버 레지스트리에서 이름과 설명만 가져옴"""
+        return SimpleFileMCPServer.tools.list(names_only=True)
     
     async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """도구 호출 시뮬레이션"""
@@ -249,29 +231,20 @@ class AnthropicMCPConceptDemo:
             }
             
         elif tool_name == "get_metadata":
-            # 메타데이터 시뮬레이션
-            category = arguments.get("category", "")
-            return {
-                "document_ids": [f"doc_{i:03d}" for i in range(10)],
-                "category": category,
-                "total_count": 100
-            }
+            # 실제 카탈로그 조회 (파일 내용은 읽지 않음)
+            filters = {key: value for key, value in arguments.items() if key not in ("fields", "limit")}
+            result = self.catalog.get_metadata(
+                fields=arguments.get("fields"), limit=arguments.get("limit"), **filters
+            )
+            result["category"] = arguments.get("category", "")
+            return result
             
         elif tool_name == "get_documents":
-            # 필터링된 문서 시뮬레이션
-            doc_ids = arguments.get("document_ids", [])
-            fields = arguments.get("fields", ["title", "summary"])
-            
-            documents = []
-            for doc_id in doc_ids:
-                doc_data = {field: f"{doc_id}_{field}" for field in fields}
-                documents.append(doc_data)
-                
-            return {
-                "documents": documents,
-                "fields": fields,
-                "count": len(documents)
-            }
+            # 요청된 필드만 프로젝션
+            return self.catalog.get_documents(
+                arguments.get("document_ids", []),
+                arguments.get("fields", ["title", "preview"])
+            )
         
         return {"error": f"Unknown tool: {tool_name}"}
     
@@ -281,25 +254,24 @@ class AnthropicMCPConceptDemo:
         cache_key = f"{tool_name}_{hashlib.md5(json.dumps(arguments, sort_keys=True).encode()).hexdigest()}"
         
         # 캐시 확인
-        if cache_key in self.state_cache:
-            cached_entry = self.state_cache[cache_key]
-            if time.time() - cached_entry["timestamp"] < 300:  # 5분 TTL
-                print(f"   🎯 캐시 히트: {tool_name}")
-                cached_entry["hit_count"] += 1
-                return cached_entry["result"]
+        cached_entry = self.state_cache.get(cache_key)
+        if cached_entry is not None:
+            print(f"   🎯 캐시 히트: {tool_name}")
+            cached_entry["hit_count"] += 1
+            return cached_entry["result"]
         
         # 캐시 미스 - 실제 실행
         print(f"   🔍 캐시 미스: {tool_name} 실행")
+        start_time = time.time()
         result = await self._call_tool(tool_name, arguments)
         
-        # 결과 저장
-        self.state_cache[cache_key] = {
+        # 결과 저장 (실행 시간이 비용: 비싸고 자주 쓰는 결과일수록 오래 유지)
+        self.state_cache.put(cache_key, {
             "result": result,
-            "timestamp": time.time(),
             "hit_count": 0,
             "tool_name": tool_name,
             "arguments": arguments
-        }
+        }, cost=time.time() - start_time)
         
         return result
 
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+MCP 예제 벤치마크 도구
+합성 대용량 코퍼스(한국어/영어, 다양한 크기)를 생성하고 다음 경로를 측정합니다:
+- RealMCPExample.search_documents
+- RealMCPExample.batch_process_documents
+- SimpleFileMCPServer의 tools/call 경로
+
+결과(처리량, 지연 시간 백분위수, 최대 RSS)는 회귀 감지를 위해 JSON으로 출력합니다.
+
+사용 예:
+    python benchmark.py --files 10000 --concurrency 8 --output bench.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union
+
+from packed_store import PackedDocumentStore
+from real_mcp_server_example import SimpleFileMCPServer
+from sharded_workspace import ShardedWorkspace
+from test import RealMCPExample
+
+CATEGORIES = ["AI", "ML", "DL", "NLP", "CV"]
+
+KOREAN_SENTENCES = [
+    "검색 증강 생성은 외부 데이터베이스에서 정보를 검색하여 답변을 생성합니다.",
+    "대규모 언어 모델은 방대한 텍스트로 사전 훈련된 신경망입니다.",
+    "벡터 데이터베이스는 임베딩을 저장하고 유사도 검색을 수행합니다.",
+    "프롬프트 엔지니어링은 원하는 결과를 얻기 위해 입력을 최적화합니다.",
+    "컨텍스트 윈도우는 모델이 한 번에 처리할 수 있는 토큰 수입니다.",
+    "미세 조정은 사전 훈련된 모델을 특정 도메인에 맞게 추가 훈련합니다.",
+]
+
+ENGLISH_SENTENCES = [
+    "Retrieval-augmented generation grounds answers in external documents.",
+    "Transformers rely on attention to model long-range dependencies.",
+    "Embeddings map text into a dense vector space for similarity search.",
+    "The Model Context Protocol standardizes how agents talk to tools.",
+    "Chain-of-thought prompting decomposes problems into intermediate steps.",
+    "Tokens are the basic unit for model input, output and billing.",
+]
+
+QUERIES = ["MCP", "모델", "vector", "검색", "attention", "AI", "토큰", "prompt"]
+
+
+def generate_corpus(work_dir: Path, file_count: int, min_size: int = 64,
+                    max_size: int = 16 * 1024, korean_ratio: float = 0.5,
+                    seed: int = 42,
+                    store: Union[PackedDocumentStore, ShardedWorkspace, None] = None) -> Dict[str, Any]:
+    """
+    합성 코퍼스 생성 (크기는 로그 균등 분포로 혼합)
+    store를 지정하면 패킹 저장소 또는 샤딩된 작업 공간에 기록
+    """
+    rng = random.Random(seed)
+    work_dir.mkdir(parents=True, exist_ok=True)
+    total_bytes = 0
+
+    def generate_document(i: int):
+        nonlocal total_bytes
+        category = CATEGORIES[i % len(CATEGORIES)]
+        target_size = int(min_size * (max_size / min_size) ** rng.random())
+        pool = KOREAN_SENTENCES if rng.random() < korean_ratio else ENGLISH_SENTENCES
+
+        parts = []
+        size = 0
+        while size < target_size:
+            sentence = rng.choice(pool)
+            parts.append(sentence)
+            size += len(sentence.encode('utf-8')) + 1
+        content = " ".join(parts)
+        total_bytes += len(content.encode('utf-8'))
+        return f"{category}_문서_{i + 1:07d}.txt", content
+
+    documents = (generate_document(i) for i in range(file_count))
+    if store is not None:
+        store.put_many(documents)
+    else:
+        for name, content in documents:
+            with open(work_dir / name, 'w', encoding='utf-8') as f:
+                f.write(content)
+
+    return {"files": file_count, "bytes": total_bytes, "korean_ratio": korean_ratio, "seed": seed}
+
+
+def peak_rss_bytes() -> int:
+    """프로세스 최대 RSS (Linux는 KB, macOS는 바이트 단위로 보고됨)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def summarize_latencies(latencies: List[float], wall_time: float) -> Dict[str, Any]:
+    """처리량과 지연 시간 백분위수 계산 (단위: ms)"""
+    if not latencies:
+        return {"operations": 0}
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        index = min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))
+        return round(ordered[index] * 1000, 3)
+
+    return {
+        "operations": len(ordered),
+        "wall_time_s": round(wall_time, 4),
+        "throughput_ops": round(len(ordered) / wall_time, 2) if wall_time > 0 else None,
+        "latency_ms": {
+            "min": round(ordered[0] * 1000, 3),
+            "mean": round(sum(ordered) / len(ordered) * 1000, 3),
+            "p50": percentile(50),
+            "p90": percentile(90),
+            "p99": percentile(99),
+            "max": round(ordered[-1] * 1000, 3),
+        },
+    }
+
+
+def run_threaded(operation: Callable[[int], Any], iterations: int, concurrency: int) -> Dict[str, Any]:
+    """동기 함수를 스레드 풀에서 반복 실행하며 호출별 지연 시간 측정"""
+    def timed(i: int) -> float:
+        start = time.perf_counter()
+        operation(i)
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = list(pool.map(timed, range(iterations)))
+    return summarize_latencies(latencies, time.perf_counter() - start)
+
+
+async def run_async(operation: Callable[[int], Any], iterations: int, concurrency: int) -> Dict[str, Any]:
+    """코루틴을 동시성 제한 하에 반복 실행하며 호출별 지연 시간 측정"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def timed(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await operation(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(iterations)))
+    return summarize_latencies(latencies, time.perf_counter() - start)
+
+
+def bench_search(handler: RealMCPExample, iterations: int, concurrency: int, use_cache: bool) -> Dict[str, Any]:
+    def operation(i: int):
+        if not use_cache:
+            handler.cache.clear()
+        handler.search_documents(QUERIES[i % len(QUERIES)], max_results=10)
+    return run_threaded(operation, iterations, concurrency)
+
+
+def bench_batch(handler: RealMCPExample, doc_ids: List[str], iterations: int,
+                concurrency: int, batch_size: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    batches = [rng.sample(doc_ids, min(batch_size, len(doc_ids))) for _ in range(iterations)]
+
+    def operation(i: int):
+        handler.batch_process_documents(batches[i])
+    return run_threaded(operation, iterations, concurrency)
+
+
+def bench_server(server: SimpleFileMCPServer, doc_names: List[str], iterations: int,
+                 concurrency: int, seed: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+
+    async def operation(i: int):
+        if i % 2 == 0:
+            request = {"name": "search_files",
+                       "arguments": {"query": QUERIES[i % len(QUERIES)], "max_results": 10}}
+        else:
+            request = {"name": "read_file", "arguments": {"path": rng.choice(doc_names)}}
+        await server.handle_request("tools/call", request)
+
+    return asyncio.run(run_async(operation, iterations, concurrency))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP 예제 벤치마크")
+    parser.add_argument("--work-dir", default="./bench_workspace", help="합성 코퍼스 디렉토리")
+    parser.add_argument("--files", type=int, default=10000, help="생성할 문서 수 (10k ~ 1M)")
+    parser.add_argument("--min-size", type=int, default=64, help="최소 문서 크기 (바이트)")
+    parser.add_argument("--max-size", type=int, default=16 * 1024, help="최대 문서 크기 (바이트)")
+    parser.add_argument("--korean-ratio", type=float, default=0.5, help="한국어 문서 비율")
+    parser.add_argument("--storage", choices=["files", "packed"], default="files",
+                        help="문서 저장 방식 (packed: 압축 세그먼트 + 오프셋 인덱스)")
+    parser.add_argument("--shards", type=int, default=0,
+                        help="샤드 디렉토리 수 (0이면 단일 디렉토리, files 저장 방식만)")
+    parser.add_argument("--reuse-corpus", action="store_true", help="기존 코퍼스가 있으면 재생성하지 않음")
+    parser.add_argument("--iterations", type=int, default=50, help="시나리오별 호출 횟수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 호출 수")
+    parser.add_argument("--batch-size", type=int, default=20, help="배치 처리당 문서 수")
+    parser.add_argument("--use-cache", action="store_true", help="검색 캐시 허용 (기본: 매 호출 캐시 비움)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="JSON 결과 파일 경로 (기본: 표준 출력)")
+    args = parser.parse_args()
+
+    work_dir = Path(args.work_dir)
+    report: Dict[str, Any] = {
+        "timestamp": time.strftime('%Y-%m-%dT%H:%M:%S'),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": vars(args),
+    }
+
+    # 예제 코드의 진행 메시지는 측정 결과와 섞이지 않도록 버림
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        handler = RealMCPExample(str(work_dir), storage=args.storage, shards=args.shards)
+        try:
+            start = time.perf_counter()
+            if args.reuse_corpus and len(handler.catalog) > 0:
+                corpus = {"files": len(handler.catalog), "reused": True}
+            else:
+                # 빈 PackedDocumentStore는 __len__이 0이라 거짓으로 평가되므로 None과 명시적으로 비교
+                store = handler.store if handler.store is not None else handler.shards
+                corpus = generate_corpus(work_dir, args.files, args.min_size, args.max_size,
+                                         args.korean_ratio, args.seed, store=store)
+                handler.catalog.invalidate()
+            corpus["generation_time_s"] = round(time.perf_counter() - start, 3)
+            report["corpus"] = corpus
+
+            doc_names = [entry.name for entry in handler.catalog.query()]
+            doc_ids = [Path(name).stem for name in doc_names]
+
+            report["search_documents"] = bench_search(handler, args.iterations, args.concurrency, args.use_cache)
+            report["batch_process_documents"] = bench_batch(
+                handler, doc_ids, args.iterations, args.concurrency, args.batch_size, args.seed)
+        finally:
+            handler.close()
+        server = SimpleFileMCPServer(str(work_dir), storage=args.storage, shards=args.shards)
+        try:
+            report["tools_call"] = bench_server(server, doc_names, args.iterations, args.concurrency, args.seed)
+        finally:
+            server.close()
+
+    report["peak_rss_bytes"] = peak_rss_bytes()
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+        print(f"✅ 벤치마크 결과 저장: {args.output}")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
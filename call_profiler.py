@@ -0,0 +1,209 @@
+"""
+도구 호출 프로파일러 (opt-in)
+- 호출 단위로 cProfile 또는 샘플링 프로파일을 수집
+- read / match / serialize / write 단계별 소요 시간(span) 측정
+- 지연 시간이 임계값을 넘은 호출만 프로파일 파일로 저장 (오프라인 분석용)
+
+저장 파일:
+    <시각>_<도구명>_<ms>ms.json     단계별 시간, 인자, 전체 지연 시간
+    <시각>_<도구명>_<ms>ms.prof     cProfile 결과 (python -m pstats 로 분석)
+    <시각>_<도구명>_<ms>ms.folded   샘플링 결과 (flamegraph.pl 입력 형식)
+"""
+
+import cProfile
+import contextlib
+import functools
+import inspect
+import json
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+_NULL_CONTEXT = contextlib.nullcontext()
+MAX_ARGUMENTS_CHARS = 2000  # 대용량 인자(예: export 데이터)는 잘라서 기록
+_current_call: ContextVar[Optional["_CallRecord"]] = ContextVar("mcp_current_call", default=None)
+
+
+class _CallRecord:
+    __slots__ = ("name", "spans")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.spans: Dict[str, float] = {}
+
+
+class _StackSampler:
+    """대상 스레드의 스택을 주기적으로 수집하는 샘플링 프로파일러"""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="mcp-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.samples[";".join(reversed(stack))] += 1
+
+    def dump(self, path: Path):
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class CallProfiler:
+    """임계값 기반 느린 호출 프로파일러"""
+
+    MODES = ("cprofile", "sample")
+
+    def __init__(self, profile_dir: Union[str, Path], threshold: float = 0.1,
+                 mode: str = "cprofile", sample_interval: float = 0.005):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown profiling mode: {mode} (allowed: {', '.join(self.MODES)})")
+        self.profile_dir = Path(profile_dir)
+        self.threshold = threshold
+        self.mode = mode
+        self.sample_interval = sample_interval
+        self.calls = 0
+        self.slow_calls = 0
+        # cProfile은 동시에 하나만 활성화할 수 있으므로 겹치는 호출은 span만 측정
+        self._profiler_busy = threading.Lock()
+
+    def span(self, phase: str):
+        """현재 호출의 단계별 시간 측정. 호출 컨텍스트 밖에서는 아무 것도 하지 않음"""
+        record = _current_call.get()
+        if record is None:
+            return _NULL_CONTEXT
+        return self._timed_span(record, phase)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _timed_span(record: _CallRecord, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record.spans[phase] = record.spans.get(phase, 0.0) + time.perf_counter() - start
+
+    @contextlib.contextmanager
+    def call(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Iterator[None]:
+        """호출 하나를 프로파일. 이미 프로파일 중인 호출 안에서는 중첩 측정하지 않음"""
+        if _current_call.get() is not None:
+            yield
+            return
+
+        record = _CallRecord(name)
+        token = _current_call.set(record)
+        collector = None
+        if self._profiler_busy.acquire(blocking=False):
+            if self.mode == "cprofile":
+                collector = cProfile.Profile()
+                collector.enable()
+            else:
+                collector = _StackSampler(threading.get_ident(), self.sample_interval)
+                collector.start()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if collector is not None:
+                if self.mode == "cprofile":
+                    collector.disable()
+                else:
+                    collector.stop()
+                self._profiler_busy.release()
+            _current_call.reset(token)
+
+            self.calls += 1
+            if elapsed >= self.threshold:
+                self.slow_calls += 1
+                self._dump(record, elapsed, arguments, collector)
+
+    def _dump(self, record: _CallRecord, elapsed: float, arguments: Optional[Dict[str, Any]], collector):
+        """느린 호출의 프로파일 저장 (저장 실패가 도구 호출을 실패시키지 않도록 함)"""
+        try:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            safe_name = re.sub(r"[^\w.-]", "_", record.name)
+            stem = f"{time.strftime('%Y%m%d-%H%M%S')}_{int(time.time() * 1000) % 1000:03d}_{safe_name}_{elapsed * 1000:.0f}ms"
+
+            arguments_json = json.dumps(arguments, ensure_ascii=False, default=str)
+            if len(arguments_json) > MAX_ARGUMENTS_CHARS:
+                arguments = arguments_json[:MAX_ARGUMENTS_CHARS] + "..."
+            report = {
+                "name": record.name,
+                "arguments": arguments,
+                "elapsed_s": round(elapsed, 6),
+                "threshold_s": self.threshold,
+                "spans_s": {phase: round(value, 6) for phase, value in record.spans.items()},
+                "mode": self.mode if collector is not None else None,
+            }
+            with open(self.profile_dir / f"{stem}.json", 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+
+            if isinstance(collector, cProfile.Profile):
+                collector.dump_stats(str(self.profile_dir / f"{stem}.prof"))
+            elif isinstance(collector, _StackSampler):
+                collector.dump(self.profile_dir / f"{stem}.folded")
+        except OSError as e:
+            print(f"⚠️ 프로파일 저장 실패: {e}", file=sys.stderr)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "slow_calls": self.slow_calls,
+            "threshold_s": self.threshold,
+            "mode": self.mode,
+            "profile_dir": str(self.profile_dir),
+        }
+
+
+def profiled(method):
+    """
+    메서드 데코레이터: 인스턴스에 profiler 속성이 설정된 경우에만 호출을 프로파일
+    (동기/비동기 메서드 모두 지원)
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            profiler = getattr(self, "profiler", None)
+            if profiler is None:
+                return await method(self, *args, **kwargs)
+            with profiler.call(method.__name__, {"args": args, "kwargs": kwargs}):
+                return await method(self, *args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        profiler = getattr(self, "profiler", None)
+        if profiler is None:
+            return method(self, *args, **kwargs)
+        with profiler.call(method.__name__, {"args": args, "kwargs": kwargs}):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def span(profiler: Optional[CallProfiler], phase: str):
+    """profiler가 없으면 비용 없는 빈 컨텍스트 반환"""
+    return _NULL_CONTEXT if profiler is None else profiler.span(phase)
@@ -0,0 +1,173 @@
+"""
+파생 데이터 저장소
+문서 내용 해시를 키로 요약, 단어 수, 글자 수, 미리보기를 저장합니다.
+- (경로, 크기, mtime) 지문이 그대로면 파일을 열지 않고 O(1)로 조회
+- 필요할 때 계산(lazy)하거나 백그라운드 인덱서로 미리 채움
+- 어떤 경로도 참조하지 않는 해시 항목과 카탈로그에서 사라진 경로는 정리하여 저장소가 무한히 커지지 않음
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+DERIVED_FILENAME = ".mcp_derived.json"
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+
+def _stat_fingerprint(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _read_text(path: str) -> str:
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class DerivedDataStore:
+    """내용 해시 기반 파생 데이터 저장소 (JSON 파일로 영속화)"""
+
+    def __init__(self, path: Union[str, Path], summarizer: Callable[[str], str]):
+        self.path = Path(path)
+        self.summarizer = summarizer
+        self._by_hash: Dict[str, Dict[str, Any]] = {}
+        # 파일 경로 → (크기, mtime_ns, 내용 해시)
+        self._fingerprints: Dict[str, Tuple[int, int, str]] = {}
+        self._refs: Counter = Counter()  # 내용 해시 → 참조하는 경로 수
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()  # 저장 직렬화 (기록 중에도 put은 막지 않음)
+        self._dirty = False
+        self._indexer: Optional[threading.Thread] = None
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self._fingerprints = {path: tuple(fp) for path, fp in data.get("fingerprints", {}).items()}
+        self._refs = Counter(fp[2] for fp in self._fingerprints.values())
+        self._by_hash = {digest: derived for digest, derived in data.get("by_hash", {}).items()
+                         if self._refs[digest]}
+
+    def save(self) -> None:
+        """
+        변경이 있을 때만 원자적으로 저장
+        (인덱서 스레드와 배치 처리가 동시에 호출해도 순서대로 기록하며, 임시 파일은 호출마다 고유)
+        """
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                data = {
+                    "by_hash": dict(self._by_hash),
+                    "fingerprints": {path: list(fp) for path, fp in self._fingerprints.items()},
+                }
+                self._dirty = False
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=self.path.parent,
+                                             prefix=self.path.name + ".", suffix=".tmp",
+                                             delete=False) as f:
+                tmp_path = f.name
+                try:
+                    json.dump(data, f, ensure_ascii=False)
+                except BaseException:
+                    f.close()
+                    os.unlink(tmp_path)
+                    raise
+            os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._by_hash)
+
+    def lookup(self, path: str, size: int, mtime_ns: int) -> Optional[Dict[str, Any]]:
+        """지문이 일치하면 파일을 읽지 않고 파생 데이터 반환"""
+        fingerprint = self._fingerprints.get(path)
+        if fingerprint is None or fingerprint[0] != size or fingerprint[1] != mtime_ns:
+            return None
+        return self._by_hash.get(fingerprint[2])
+
+    def put(self, path: str, size: int, mtime_ns: int, content: str) -> Dict[str, Any]:
+        """내용으로부터 파생 데이터를 계산(해시가 같으면 재사용)하고 지문 등록"""
+        digest = content_hash(content)
+        derived = self._by_hash.get(digest)
+        if derived is None:
+            derived = {
+                "summary": self.summarizer(content),
+                "word_count": len(content.split()),
+                "char_count": len(content),
+                "preview": content[:100] + "..." if len(content) > 100 else content,
+            }
+        with self._lock:
+            self._by_hash[digest] = derived
+            previous = self._fingerprints.get(path)
+            self._fingerprints[path] = (size, mtime_ns, digest)
+            self._refs[digest] += 1
+            if previous is not None:
+                self._release(previous[2])
+            self._dirty = True
+        return derived
+
+    def _release(self, digest: str) -> None:
+        """경로 하나의 참조 해제 (마지막 참조였으면 파생 데이터도 삭제, _lock 안에서 호출)"""
+        self._refs[digest] -= 1
+        if self._refs[digest] <= 0:
+            del self._refs[digest]
+            self._by_hash.pop(digest, None)
+
+    def prune(self, live_paths: Iterable[str]) -> int:
+        """live_paths에 없는 경로(삭제된 문서)의 지문과 파생 데이터를 제거하고 제거한 경로 수 반환"""
+        live = set(live_paths)
+        with self._lock:
+            stale = [path for path in self._fingerprints if path not in live]
+            for path in stale:
+                self._release(self._fingerprints.pop(path)[2])
+            if stale:
+                self._dirty = True
+        return len(stale)
+
+    def index_file(self, path: str,
+                   fingerprint: Optional[Callable[[str], Tuple[int, int]]] = None,
+                   reader: Optional[Callable[[str], str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        파일 하나를 (필요하면) 읽어서 파생 데이터 등록
+        fingerprint/reader를 지정하면 파일 시스템 대신 사용 (예: 패킹 저장소)
+        """
+        size, mtime_ns = (fingerprint or _stat_fingerprint)(path)
+        derived = self.lookup(path, size, mtime_ns)
+        if derived is not None:
+            return derived
+        content = (reader or _read_text)(path)
+        return self.put(path, size, mtime_ns, content)
+
+    def start_indexer(self, paths: Iterable[str],
+                      fingerprint: Optional[Callable[[str], Tuple[int, int]]] = None,
+                      reader: Optional[Callable[[str], str]] = None) -> threading.Thread:
+        """
+        백그라운드 스레드에서 누락된 파생 데이터를 채우고 저장
+        paths는 작업 공간 전체 목록으로 보고, 여기에 없는 경로의 항목은 정리
+        """
+        if self._indexer is not None and self._indexer.is_alive():
+            return self._indexer
+        paths = list(paths)
+
+        def run():
+            for path in paths:
+                try:
+                    self.index_file(path, fingerprint, reader)
+                except (OSError, UnicodeDecodeError):
+                    continue
+            self.prune(paths)
+            self.save()
+
+        self._indexer = threading.Thread(target=run, name="derived-indexer", daemon=True)
+        self._indexer.start()
+        return self._indexer
@@ -0,0 +1,136 @@
+"""
+증분 실행 통계
+실행 로그 항목이 추가될 때마다 누적 집계와 슬라이딩 시간 창(최근 1분/5분/1시간)을 갱신합니다.
+- 조회 시 로그 전체를 다시 훑지 않음 (작업 유형 수에만 비례, 대시보드 폴링용)
+- 시간 창은 고정 폭 버킷의 deque로 관리하여 만료된 버킷만 빼냄
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from records import LogEntry
+
+# (이름, 창 길이 초, 버킷 폭 초)
+WINDOWS = (("1m", 60, 1), ("5m", 300, 5), ("1h", 3600, 60))
+
+
+def is_search(action: str) -> bool:
+    return action.startswith("search")
+
+
+def is_cached(action: str) -> bool:
+    return action.endswith("_cached")
+
+
+def is_batch(action: str) -> bool:
+    return action == "batch_process"
+
+
+class ActionTotals:
+    """작업 유형별 호출 수와 실행 시간 합계"""
+
+    __slots__ = ("counts", "times", "results")
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.times: Dict[str, float] = {}
+        self.results = 0  # results_count 합계 (검색된 파일 수)
+
+    def add(self, entry: LogEntry, sign: int = 1) -> None:
+        action = entry.action
+        self.counts[action] = self.counts.get(action, 0) + sign
+        self.times[action] = self.times.get(action, 0.0) + sign * (entry.execution_time or 0.0)
+        self.results += sign * (entry.results_count or 0)
+        if self.counts[action] == 0:
+            del self.counts[action]
+            del self.times[action]
+
+    def merge(self, other: "ActionTotals", sign: int = 1) -> None:
+        for action, count in other.counts.items():
+            self.counts[action] = self.counts.get(action, 0) + sign * count
+            self.times[action] = self.times.get(action, 0.0) + sign * other.times[action]
+            if self.counts[action] == 0:
+                del self.counts[action]
+                del self.times[action]
+        self.results += sign * other.results
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def summary(self) -> Dict[str, Any]:
+        search = sum(count for action, count in self.counts.items() if is_search(action))
+        cached = sum(count for action, count in self.counts.items() if is_cached(action))
+        return {
+            "operations": self.total,
+            "actions": {
+                action: {
+                    "count": count,
+                    "time": round(self.times[action], 6),
+                    "avg_time": round(self.times[action] / count, 6),
+                }
+                for action, count in self.counts.items()
+            },
+            "cache_hit_ratio": round(cached / search, 4) if search else 0.0,
+        }
+
+
+class RollingWindow:
+    """최근 span초 동안의 집계 (resolution초 단위 버킷, 창 경계는 버킷 폭만큼 근사)"""
+
+    def __init__(self, span: int, resolution: int):
+        self.span = span
+        self.resolution = resolution
+        self.totals = ActionTotals()
+        self._buckets: Deque[Tuple[int, ActionTotals]] = deque()
+
+    def add(self, entry: LogEntry) -> None:
+        start = int(entry.timestamp // self.resolution) * self.resolution
+        # 순서가 뒤바뀐(더 이전) 항목은 최신 버킷에 합쳐 버킷 순서를 유지
+        if not self._buckets or self._buckets[-1][0] < start:
+            self._buckets.append((start, ActionTotals()))
+        self._buckets[-1][1].add(entry)
+        self.totals.add(entry)
+        self.expire(entry.timestamp)
+
+    def expire(self, now: float) -> None:
+        """창 밖으로 벗어난 버킷 제거 (각 버킷은 한 번만 빠지므로 분할 상환 O(1))"""
+        while self._buckets and self._buckets[0][0] + self.resolution <= now - self.span:
+            _, bucket = self._buckets.popleft()
+            self.totals.merge(bucket, sign=-1)
+
+    def summary(self, now: float) -> Dict[str, Any]:
+        self.expire(now)
+        return self.totals.summary()
+
+
+class ExecutionStats:
+    """실행 로그 누적 집계 + 슬라이딩 창 (여러 스레드에서 기록 가능)"""
+
+    def __init__(self):
+        self.totals = ActionTotals()
+        self.windows = {name: RollingWindow(span, resolution) for name, span, resolution in WINDOWS}
+        self._lock = threading.Lock()
+
+    def record(self, entry: LogEntry) -> None:
+        with self._lock:
+            self.totals.add(entry)
+            for window in self.windows.values():
+                window.add(entry)
+
+    def count(self, predicate: Callable[[str], bool]) -> int:
+        """조건에 맞는 작업 유형의 누적 호출 수"""
+        with self._lock:
+            return sum(count for action, count in self.totals.counts.items() if predicate(action))
+
+    def time(self, predicate: Callable[[str], bool]) -> float:
+        """조건에 맞는 작업 유형의 누적 실행 시간"""
+        with self._lock:
+            return sum(seconds for action, seconds in self.totals.times.items() if predicate(action))
+
+    def window_summaries(self, now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        now = time.time() if now is None else now
+        with self._lock:
+            return {name: window.summary(now) for name, window in self.windows.items()}
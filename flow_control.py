@@ -0,0 +1,176 @@
+"""
+stdio 전송 흐름 제어
+- BoundedWriter: 크기 제한 큐 + 비동기 드레인 태스크 (느린 소비자는 큐가 찰 때 생산자만 대기시킴)
+- encode_line_frames: max_frame_bytes를 넘는 응답은 notifications/chunk 메시지 여러 줄로 분할
+- ChunkAssembler: 클라이언트 측 청크 재조립 (요청 id별)
+"""
+
+import asyncio
+import json
+import os
+import stat
+import sys
+from collections import deque
+from typing import Any, BinaryIO, Deque, Dict, List, Optional
+
+CHUNK_METHOD = "notifications/chunk"
+DEFAULT_MAX_FRAME_BYTES = 1024 * 1024
+DEFAULT_WRITE_QUEUE_SIZE = 64
+MIN_FRAME_BYTES = 1024
+CHUNK_OVERHEAD = 256  # 청크 메시지의 JSON 껍데기 여유분
+
+
+def encode_line_frames(message: Dict[str, Any], max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES) -> List[bytes]:
+    """
+    메시지를 줄 단위 프레임 목록으로 인코딩
+    직렬화 결과가 max_frame_bytes 이하이면 한 줄, 넘으면 청크 메시지 여러 줄
+    (ASCII JSON 문자열을 문자열 값으로 다시 넣으면 이스케이프로 최대 2배가 되므로 조각은 절반 크기)
+    """
+    if max_frame_bytes < MIN_FRAME_BYTES:
+        raise ValueError(f"max_frame_bytes must be >= {MIN_FRAME_BYTES}")
+    payload = json.dumps(message)
+    if len(payload) + 1 <= max_frame_bytes:
+        return [(payload + "\n").encode('ascii')]
+
+    piece = max_frame_bytes // 2 - CHUNK_OVERHEAD
+    total = (len(payload) + piece - 1) // piece
+    frames = []
+    for seq in range(total):
+        chunk = {
+            "jsonrpc": "2.0",
+            "method": CHUNK_METHOD,
+            "params": {"id": message.get("id"), "seq": seq, "total": total,
+                       "data": payload[seq * piece:(seq + 1) * piece]},
+        }
+        frames.append((json.dumps(chunk) + "\n").encode('ascii'))
+    return frames
+
+
+class ChunkAssembler:
+    """청크 메시지를 요청 id별로 모아 원래 메시지로 복원"""
+
+    def __init__(self):
+        self._pending: Dict[Any, List[str]] = {}
+
+    def feed(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """청크가 아니면 그대로, 마지막 청크면 복원된 메시지, 그 외에는 None"""
+        if message.get("method") != CHUNK_METHOD:
+            return message
+        params = message.get("params", {})
+        key = params.get("id")
+        parts = self._pending.setdefault(key, [])
+        if params.get("seq") != len(parts):
+            del self._pending[key]
+            raise ValueError(f"Out-of-order chunk for id {key}: {params.get('seq')} != {len(parts)}")
+        parts.append(params.get("data", ""))
+        if len(parts) < params.get("total", 0):
+            return None
+        del self._pending[key]
+        return json.loads("".join(parts))
+
+
+class _ThreadedWriter:
+    """파이프가 아닌 stdout(파일, 터미널)용: 실제 쓰기는 스레드에서 수행"""
+
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self._pending: List[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self._pending.append(data)
+
+    async def drain(self) -> None:
+        data = b"".join(self._pending)
+        self._pending.clear()
+        if data:
+            await asyncio.to_thread(self._write, data)
+
+    def _write(self, data: bytes) -> None:
+        self.stream.write(data)
+        self.stream.flush()
+
+    def close(self) -> None:
+        pass
+
+
+async def open_stdout_writer():
+    """
+    stdout용 비동기 writer
+    파이프/소켓이면 asyncio 파이프 전송(drain이 실제 흐름 제어), 아니면 스레드 기반 writer
+    """
+    sys.stdout.flush()
+    mode = os.fstat(sys.stdout.fileno()).st_mode
+    if stat.S_ISFIFO(mode) or stat.S_ISSOCK(mode):
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.connect_write_pipe(asyncio.streams.FlowControlMixin, sys.stdout)
+        return asyncio.StreamWriter(transport, protocol, None, loop)
+    return _ThreadedWriter(sys.stdout.buffer)
+
+
+class BoundedWriter:
+    """
+    크기 제한 큐를 통해 프레임을 내보내는 writer
+    큐 자리는 기다린 순서대로 넘겨주므로 (asyncio.Queue와 달리) 청크가 많은 큰 응답이
+    뒤에 도착한 작은 응답을 굶기지 않고 프레임 단위로 번갈아 기록됨
+    """
+
+    def __init__(self, writer, max_queue: int = DEFAULT_WRITE_QUEUE_SIZE):
+        if max_queue < 1:
+            raise ValueError("max_queue must be >= 1")
+        self.writer = writer
+        self.queue: "asyncio.Queue[bytes]" = asyncio.Queue()
+        self._free = max_queue
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._task = asyncio.create_task(self._drain_loop())
+        self.error: Optional[BaseException] = None
+
+    async def send(self, frame: bytes) -> None:
+        """프레임 추가 (큐가 가득 찼거나 먼저 기다리는 생산자가 있으면 차례가 올 때까지 대기)"""
+        if self.error is not None:
+            raise ConnectionError(f"Output closed: {self.error!r}")
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter  # 깨어날 때 자리를 넘겨받음
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+        self.queue.put_nowait(frame)
+
+    def _release(self) -> None:
+        """자리 하나 반환 (기다리는 생산자가 있으면 가장 먼저 온 쪽에 양도)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free += 1
+
+    async def _drain_loop(self) -> None:
+        while True:
+            frame = await self.queue.get()
+            self._release()
+            try:
+                if self.error is None:
+                    self.writer.write(frame)
+                    await self.writer.drain()
+            except (ConnectionError, OSError) as e:
+                self.error = e  # 소비자가 사라짐: 남은 프레임은 버림
+            finally:
+                self.queue.task_done()
+
+    async def close(self) -> None:
+        """남은 프레임을 모두 내보낸 뒤 종료"""
+        await self.queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self.writer.close()
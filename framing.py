@@ -0,0 +1,52 @@
+"""
+길이 접두사 프레이밍
+소켓 전송용으로 JSON-RPC 메시지를 [4바이트 빅엔디언 길이][UTF-8 JSON] 프레임으로 주고받습니다.
+- 줄 단위 읽기와 달리 메시지 안의 개행이나 크기에 영향을 받지 않음
+- 상한(MAX_FRAME_BYTES)을 넘는 프레임은 읽기 전에 거부
+"""
+
+import asyncio
+import json
+import struct
+from typing import Any, Dict, Optional
+
+HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+class FrameError(ValueError):
+    """잘못되었거나 상한을 넘는 프레임 (스트림 경계를 잃으므로 연결을 닫아야 함)"""
+
+
+class PayloadError(ValueError):
+    """프레임은 온전하지만 내용이 JSON이 아님 (다음 프레임은 계속 읽을 수 있음)"""
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    payload = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    if len(payload) > MAX_FRAME_BYTES:
+        raise FrameError(f"Frame too large: {len(payload)} bytes (max {MAX_FRAME_BYTES})")
+    return HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """프레임 하나 읽기. 프레임 경계에서 연결이 닫히면 None, 내용이 JSON이 아니면 PayloadError"""
+    try:
+        header = await reader.readexactly(HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise FrameError("Connection closed inside frame header")
+    (length,) = HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise FrameError(f"Frame too large: {length} bytes (max {MAX_FRAME_BYTES})")
+    payload = await reader.readexactly(length)
+    try:
+        return json.loads(payload)
+    except ValueError as e:
+        raise PayloadError(str(e)) from None
+
+
+async def write_frame(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+    writer.write(encode_frame(message))
+    await writer.drain()
@@ -0,0 +1,59 @@
+"""
+메타데이터 도구 (SimpleFileMCPServer에서 지연 로드)
+get_metadata / get_documents 구현과 입력 스키마를 함께 둡니다.
+"""
+
+from typing import Any, Dict, List, Optional
+
+SCHEMAS = {
+    "get_metadata": {
+        "type": "object",
+        "properties": {
+            "category": {"type": "string"},
+            "name_pattern": {"type": "string"},
+            "min_size": {"type": "integer"},
+            "max_size": {"type": "integer"},
+            "modified_after": {"type": "string"},
+            "modified_before": {"type": "string"},
+            "fields": {"type": "array", "items": {"type": "string"}},
+            "limit": {"type": "integer"}
+        },
+        "required": []
+    },
+    "get_documents": {
+        "type": "object",
+        "properties": {
+            "document_ids": {"type": "array", "items": {"type": "string"}},
+            "fields": {"type": "array", "items": {"type": "string"}}
+        },
+        "required": ["document_ids"]
+    },
+}
+
+
+async def get_metadata(server, category: Optional[str] = None, name_pattern: Optional[str] = None,
+                       min_size: Optional[int] = None, max_size: Optional[int] = None,
+                       modified_after: Optional[str] = None, modified_before: Optional[str] = None,
+                       fields: Optional[List[str]] = None, limit: Optional[int] = None) -> Dict[str, Any]:
+    """메타데이터 조회 구현 (stat 정보만 사용)"""
+    try:
+        result = server.catalog.get_metadata(
+            fields=fields, limit=limit, category=category, name_pattern=name_pattern,
+            min_size=min_size, max_size=max_size,
+            modified_after=modified_after, modified_before=modified_before
+        )
+    except Exception as e:
+        return {"error": f"Metadata query failed: {str(e)}"}
+    result["summary"] = f"Found {result['total_count']} documents"
+    return result
+
+
+async def get_documents(server, document_ids: Optional[List[str]] = None,
+                        fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """필드 프로젝션 문서 조회 구현"""
+    try:
+        result = server.catalog.get_documents(document_ids or [], fields)
+    except Exception as e:
+        return {"error": f"Document query failed: {str(e)}"}
+    result["summary"] = f"Returned {result['count']} documents"
+    return result
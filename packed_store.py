@@ -0,0 +1,251 @@
+"""
+압축 패킹 문서 저장소 (선택 사항)
+문서마다 작은 .txt 파일을 두는 대신 하나의 append-only 세그먼트 파일에 압축 블록으로 저장합니다.
+- documents.seg: 문서별 압축 블록을 이어 붙인 세그먼트 파일
+- documents.idx: 오프셋 인덱스 (JSON Lines, append-only, 같은 이름은 마지막 항목이 유효)
+- 임의 접근은 os.pread 한 번, 전체 스캔은 mmap 순차 읽기 (파일 open/stat 없음)
+- 압축: zlib 기본, zstandard 패키지가 설치되어 있으면 codec="zstd" 사용 가능
+- 내용 해시가 같은 문서는 다시 쓰지 않고, 죽은 바이트 비율이 높아지면 살아 있는 블록만 남기도록 압축(compact)
+  (쓰기는 한 프로세스만, 읽기 전용 프로세스는 인덱스 교체를 감지해 다시 로드)
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+SEGMENT_FILENAME = "documents.seg"
+INDEX_FILENAME = "documents.idx"
+FORMAT_VERSION = 1
+COMPACT_RATIO = 0.5              # 세그먼트 중 죽은 바이트 비율이 이보다 크면 compact
+COMPACT_MIN_BYTES = 64 * 1024    # 작은 세그먼트는 압축하지 않음
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class PackedEntry(NamedTuple):
+    offset: int
+    length: int
+    size: int        # 압축 전 UTF-8 바이트 수
+    mtime_ns: int
+    digest: str = ""  # 압축 전 내용 해시 (이전 형식 인덱스에는 없음)
+
+
+class PackedDocumentStore:
+    """append-only 세그먼트 + 오프셋 인덱스 기반 문서 저장소"""
+
+    CODECS = ("zlib", "zstd")
+
+    def __init__(self, root: Union[str, Path], codec: str = "zlib", level: int = 6,
+                 compact_ratio: float = COMPACT_RATIO):
+        """compact_ratio: put_many 후 죽은 바이트 비율이 이 값을 넘으면 자동 compact (1 이상이면 비활성)"""
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_path = self.root / SEGMENT_FILENAME
+        self.index_path = self.root / INDEX_FILENAME
+        self.level = level
+        self.compact_ratio = compact_ratio
+        self._entries: Dict[str, PackedEntry] = {}
+        self._index_pos = 0
+        self._index_ino: Optional[int] = None  # compact로 인덱스가 교체되면 바뀜
+        self._lock = threading.Lock()
+        self.version = 0  # 인덱스가 바뀔 때마다 증가 (카탈로그 재구성 판단용)
+
+        if self.index_path.exists():
+            self.codec = self._read_header()
+        else:
+            self.codec = codec
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({"codec": codec, "version": FORMAT_VERSION}) + "\n")
+            self.segment_path.touch()
+        self._fd: Optional[int] = None
+        self._reopen_segment()  # 임의 접근용 읽기 핸들 (재사용)
+        if self.codec not in self.CODECS:
+            raise ValueError(f"Unknown codec: {self.codec} (allowed: {', '.join(self.CODECS)})")
+        if self.codec == "zstd" and zstandard is None:
+            raise RuntimeError("codec='zstd' requires the 'zstandard' package (pip install zstandard)")
+        self.reload()
+
+    def _read_header(self) -> str:
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            return json.loads(f.readline())["codec"]
+
+    def reload(self) -> bool:
+        """다른 프로세스가 추가한 인덱스 항목 반영. 변경이 있으면 True"""
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return False
+        if stat.st_ino == self._index_ino and stat.st_size == self._index_pos:
+            return False
+        with self._lock, open(self.index_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_ino != self._index_ino:
+                # 다른 프로세스가 compact함: 세그먼트도 교체되었으므로 처음부터 다시 읽음
+                # (compact는 세그먼트를 먼저 교체하므로 새 인덱스를 보면 새 세그먼트도 보장됨)
+                self._entries = {}
+                self._index_pos = 0
+                self._index_ino = os.fstat(f.fileno()).st_ino
+                self._reopen_segment()
+            f.seek(self._index_pos)
+            if self._index_pos == 0:
+                f.readline()  # 헤더
+            changed = False
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # 기록 중인 마지막 줄은 다음에 다시 읽음
+                name, *fields = json.loads(line)
+                self._entries[name] = PackedEntry(*fields)
+                self._index_pos = f.tell()
+                changed = True
+            if self._index_pos == 0:
+                self._index_pos = f.tell()
+            if changed:
+                self.version += 1
+            return changed
+
+    def _reopen_segment(self) -> None:
+        fd = os.open(self.segment_path, os.O_RDONLY)
+        if self._fd is not None:
+            os.close(self._fd)
+        self._fd = fd
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return zlib.compress(data, self.level)
+
+    def _decompress(self, block: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdDecompressor().decompress(block)
+        return zlib.decompress(block)
+
+    def put_many(self, documents: Iterable[Tuple[str, str]]) -> int:
+        """
+        여러 문서를 세그먼트 끝에 추가하고 실제로 기록한 문서 수 반환 (open은 세그먼트/인덱스 각각 한 번)
+        내용 해시가 저장된 것과 같은 문서는 건너뜀 (mtime도 유지)
+        """
+        count = 0
+        with self._lock, open(self.segment_path, 'ab') as segment, \
+                open(self.index_path, 'a', encoding='utf-8') as index:
+            offset = segment.tell()
+            lines = []
+            for name, content in documents:
+                data = content.encode('utf-8')
+                digest = _digest(data)
+                current = self._entries.get(name)
+                if current is not None and current.digest == digest:
+                    continue
+                block = self._compress(data)
+                segment.write(block)
+                entry = PackedEntry(offset, len(block), len(data), time.time_ns(), digest)
+                self._entries[name] = entry
+                lines.append(json.dumps([name, *entry], ensure_ascii=False) + "\n")
+                offset += len(block)
+                count += 1
+            if lines:
+                segment.flush()
+                index.writelines(lines)  # 세그먼트 기록 후 인덱스 기록
+                index.flush()
+                self._index_pos = index.tell()
+                self.version += 1
+        if count and self._should_compact():
+            self.compact()
+        return count
+
+    def _should_compact(self) -> bool:
+        size = os.stat(self.segment_path).st_size
+        return size >= COMPACT_MIN_BYTES and self.dead_bytes() > size * self.compact_ratio
+
+    def compact(self) -> int:
+        """
+        살아 있는 블록만 새 세그먼트/인덱스로 다시 써서 교체하고 회수한 바이트 수 반환
+        세그먼트를 먼저 교체한 뒤 인덱스를 교체 (읽기 프로세스는 인덱스 inode 변화로 감지)
+        """
+        with self._lock:
+            before = os.stat(self.segment_path).st_size
+            segment_tmp = self.segment_path.with_name(self.segment_path.name + ".compact")
+            index_tmp = self.index_path.with_name(self.index_path.name + ".compact")
+            entries: Dict[str, PackedEntry] = {}
+            offset = 0
+            with open(segment_tmp, 'wb') as segment, open(index_tmp, 'w', encoding='utf-8') as index:
+                index.write(json.dumps({"codec": self.codec, "version": FORMAT_VERSION}) + "\n")
+                for name, entry in sorted(self._entries.items(), key=lambda item: item[1].offset):
+                    block = os.pread(self._fd, entry.length, entry.offset)
+                    segment.write(block)
+                    entries[name] = entry._replace(offset=offset)
+                    index.write(json.dumps([name, *entries[name]], ensure_ascii=False) + "\n")
+                    offset += len(block)
+                segment.flush()
+                os.fsync(segment.fileno())
+                index.flush()
+                os.fsync(index.fileno())
+                index_pos = index.tell()
+            os.replace(segment_tmp, self.segment_path)
+            os.replace(index_tmp, self.index_path)
+            self._reopen_segment()
+            self._entries = entries
+            self._index_pos = index_pos
+            self._index_ino = os.stat(self.index_path).st_ino
+            self.version += 1
+            return before - offset
+
+    def put(self, name: str, content: str) -> None:
+        self.put_many([(name, content)])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def entries(self) -> Dict[str, PackedEntry]:
+        return dict(self._entries)
+
+    def stat(self, name: str) -> Optional[PackedEntry]:
+        return self._entries.get(name)
+
+    def get(self, name: str) -> Optional[str]:
+        """단일 문서 임의 접근 (pread 한 번)"""
+        entry = self._entries.get(name)
+        if entry is None and self.reload():
+            entry = self._entries.get(name)
+        if entry is None:
+            return None
+        block = os.pread(self._fd, entry.length, entry.offset)
+        return self._decompress(block).decode('utf-8')
+
+    def scan(self, names: Optional[List[str]] = None) -> Iterator[Tuple[str, PackedEntry, str]]:
+        """세그먼트를 오프셋 순서로 순차 읽기하며 (이름, 엔트리, 내용) 반환"""
+        self.reload()
+        targets = self._entries.items() if names is None else \
+            [(name, self._entries[name]) for name in names if name in self._entries]
+        ordered = sorted(targets, key=lambda item: item[1].offset)
+        if not ordered:
+            return
+        # 경로 대신 열어 둔 핸들을 매핑: compact 중에도 로드된 인덱스와 같은 세그먼트를 읽음
+        with mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ) as mm:
+            for name, entry in ordered:
+                block = mm[entry.offset:entry.offset + entry.length]
+                yield name, entry, self._decompress(block).decode('utf-8')
+
+    def dead_bytes(self) -> int:
+        """덮어쓰기로 더 이상 참조되지 않는 세그먼트 바이트 수"""
+        live = sum(entry.length for entry in self._entries.values())
+        return max(0, os.stat(self.segment_path).st_size - live)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,221 @@
+"""
+다중 패턴 / 정규식 검색
+- AhoCorasick: 여러 리터럴을 하나의 오토마톤으로 컴파일하여 문서를 한 번만 스캔
+- required_literals: 정규식이 일치하려면 반드시 포함해야 하는 리터럴 조각 추출
+- TrigramIndex: 문서별 트라이그램 인덱스로 필수 리터럴을 포함할 수 있는 후보 문서만 선별
+"""
+
+import threading
+from collections import defaultdict, deque
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+try:
+    from re import _constants as sre_constants, _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_constants
+    import sre_parse
+
+TRIGRAM = 3
+
+
+class AhoCorasick:
+    """
+    리터럴 패턴 집합의 Aho-Corasick 오토마톤 (대소문자 무시 기본)
+    실패 링크를 미리 펼친 DFA로 컴파일하여 문자당 dict 조회 한 번으로 스캔
+    """
+
+    def __init__(self, patterns: Iterable[str], case_insensitive: bool = True):
+        self.case_insensitive = case_insensitive
+        self.patterns = list(dict.fromkeys(patterns))  # 순서를 유지한 중복 제거
+        if not self.patterns or not all(self.patterns):
+            raise ValueError("patterns must be non-empty strings")
+
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[Tuple[int, ...]] = [()]
+        for index, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in self._fold(pattern):
+                child = goto[node].get(ch)
+                if child is None:
+                    child = len(goto)
+                    goto[node][ch] = child
+                    goto.append({})
+                    outputs.append(())
+                node = child
+            outputs[node] += (index,)
+
+        # BFS로 실패 링크를 계산하면서 각 상태의 전이 테이블을 완성 (실패 상태의 전이 상속)
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [{} for _ in goto]
+        delta[0] = dict(goto[0])
+        queue = deque(goto[0].values())
+        for child in queue:  # 깊이 1 상태의 실패 링크는 루트
+            delta[child] = dict(goto[0])
+            delta[child].update(goto[child])
+        while queue:
+            node = queue.popleft()
+            for ch, child in goto[node].items():
+                fail[child] = delta[fail[node]].get(ch, 0)
+                outputs[child] += outputs[fail[child]]
+                delta[child] = dict(delta[fail[child]])
+                delta[child].update(goto[child])
+                queue.append(child)
+        self._delta = delta
+        self._outputs = outputs
+
+    def _fold(self, text: str) -> str:
+        return text.lower() if self.case_insensitive else text
+
+    def counts(self, text: str) -> List[int]:
+        """패턴별 출현 횟수 (겹치는 출현 포함)"""
+        counts = [0] * len(self.patterns)
+        delta = self._delta
+        outputs = self._outputs
+        node = 0
+        for ch in self._fold(text):
+            node = delta[node].get(ch, 0)
+            if outputs[node]:
+                for index in outputs[node]:
+                    counts[index] += 1
+        return counts
+
+    def matches(self, text: str) -> Dict[str, int]:
+        """출현한 패턴만 {패턴: 횟수}로 반환"""
+        return {pattern: count for pattern, count in zip(self.patterns, self.counts(text)) if count}
+
+
+def required_literals(pattern: str, flags: int = 0, min_length: int = TRIGRAM) -> List[str]:
+    """
+    정규식이 일치하려면 반드시 포함해야 하는 리터럴 조각 목록
+    분기(|), 선택적 반복, 문자 클래스는 리터럴을 끊으며 그 안쪽은 필수로 보지 않음
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return []
+    literals: List[str] = []
+    _collect_literals(parsed, literals)
+    return [literal for literal in literals if len(literal) >= min_length]
+
+
+def _collect_literals(items, literals: List[str]) -> None:
+    run: List[str] = []
+
+    def flush():
+        if run:
+            literals.append("".join(run))
+            run.clear()
+
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            run.append(chr(av))
+        elif op is sre_constants.SUBPATTERN:
+            flush()
+            _collect_literals(av[-1], literals)
+        elif op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT) and av[0] >= 1:
+            flush()
+            _collect_literals(av[2], literals)
+        else:
+            flush()
+    flush()
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + TRIGRAM] for i in range(len(text) - TRIGRAM + 1)}
+
+
+class TrigramIndex:
+    """
+    문서 경로 → 트라이그램 집합 인덱스 (소문자 기준, 파일 이름 포함)
+    (크기, mtime_ns) 지문이 바뀐 문서만 다시 읽어 갱신
+    여러 스레드/요청에서 동시에 써도 됨: refresh는 하나씩 실행되고, 문서 단위 갱신과
+    후보 계산은 같은 락 아래에서 일어나므로 후보는 항상 일관된 postings에서 계산됨
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._documents: Dict[str, Tuple[Tuple[int, int], FrozenSet[str]]] = {}
+        self._lock = threading.Lock()          # postings / 문서 표 보호 (짧게 잡음)
+        self._refresh_lock = threading.Lock()  # refresh 직렬화 (파일을 읽는 동안 유지)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _remove(self, path: str) -> None:
+        _, grams = self._documents.pop(path)
+        for gram in grams:
+            postings = self._postings.get(gram)
+            if postings is not None:
+                postings.discard(path)
+                if not postings:
+                    del self._postings[gram]
+
+    def refresh(self, paths: Iterable[str], fingerprint: Callable[[str], Tuple[int, int]],
+                reader: Callable[[str], str]) -> int:
+        """현재 문서 목록과 동기화하고 다시 색인한 문서 수 반환"""
+        with self._refresh_lock:
+            seen = set()
+            updated = 0
+            for path in paths:
+                seen.add(path)
+                try:
+                    current = fingerprint(path)
+                    known = self._documents.get(path)
+                    if known is not None and known[0] == current:
+                        continue
+                    content = reader(path)
+                except (OSError, UnicodeDecodeError):
+                    continue
+                # 파일 읽기와 트라이그램 추출은 락 밖에서, 인덱스 반영만 락 안에서
+                grams = frozenset(trigrams(path.rsplit("/", 1)[-1].lower() + "\n" + content.lower()))
+                with self._lock:
+                    if path in self._documents:
+                        self._remove(path)
+                    self._documents[path] = (current, grams)
+                    for gram in grams:
+                        self._postings[gram].add(path)
+                updated += 1
+            with self._lock:
+                for path in [path for path in self._documents if path not in seen]:
+                    self._remove(path)
+            return updated
+
+    def candidates(self, literal: str) -> Optional[Set[str]]:
+        """리터럴을 포함할 수 있는 문서 집합. 트라이그램보다 짧으면 None (필터 불가)"""
+        with self._lock:
+            return self._candidates(literal)
+
+    def _candidates(self, literal: str) -> Optional[Set[str]]:
+        grams = trigrams(literal.lower())
+        if not grams:
+            return None
+        result: Optional[Set[str]] = None
+        for gram in sorted(grams, key=lambda gram: len(self._postings.get(gram, ()))):
+            postings = self._postings.get(gram)
+            if not postings:
+                return set()
+            result = set(postings) if result is None else result & postings
+            if not result:
+                break
+        return result
+
+    def candidates_all(self, literals: Iterable[str]) -> Optional[Set[str]]:
+        """모든 리터럴을 포함할 수 있는 문서 (정규식 필수 리터럴용)"""
+        result: Optional[Set[str]] = None
+        with self._lock:
+            for literal in literals:
+                found = self._candidates(literal)
+                if found is not None:
+                    result = found if result is None else result & found
+        return result
+
+    def candidates_any(self, literals: Iterable[str]) -> Optional[Set[str]]:
+        """리터럴 중 하나라도 포함할 수 있는 문서 (다중 패턴용). 짧은 리터럴이 있으면 None"""
+        result: Set[str] = set()
+        with self._lock:
+            for literal in literals:
+                found = self._candidates(literal)
+                if found is None:
+                    return None
+                result |= found
+        return result
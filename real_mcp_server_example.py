@@ -5,33 +5,106 @@
 """
 
 import asyncio
+import contextlib
+import errno
 import json
-import subprocess
+import os
+import re
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List
+from stat import S_ISSOCK
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from call_profiler import CallProfiler, span
+from flow_control import (DEFAULT_MAX_FRAME_BYTES, DEFAULT_WRITE_QUEUE_SIZE, BoundedWriter,
+                          ChunkAssembler, encode_line_frames, open_stdout_writer)
+from framing import FrameError, PayloadError, encode_frame, read_frame, write_frame
+from packed_store import PackedDocumentStore
+from pattern_search import AhoCorasick, TrigramIndex, required_literals
+from tool_registry import InvalidParams, ToolRegistry
+
+# 서버 도구 레지스트리 (메서드 데코레이터로 등록, 메타데이터 도구는 지연 로드)
+TOOLS = ToolRegistry()
 class RealMCPServerClient:
     """실제 MCP 서버와 통신하는 클라이언트"""
     
-    def __init__(self, server_command: List[str]):
+    def __init__(self, server_command: List[str], verbose: bool = True,
+                 stream_limit: int = 8 * DEFAULT_MAX_FRAME_BYTES):
         self.server_command = server_command
         self.server_process = None
         self.request_id = 0
+        self.verbose = verbose  # False면 요청/응답 진행 메시지 생략 (풀 워커용)
+        self.stream_limit = stream_limit  # stdout 한 줄 최대 크기 (서버 max_frame_bytes보다 커야 함)
+        self.chunks = ChunkAssembler()
+        
+    def _log(self, message: str):
+        if self.verbose:
+            print(message)
+        
+    @property
+    def alive(self) -> bool:
+        return self.server_process is not None and self.server_process.returncode is None
         
-    async def start_server(self):
-        """MCP 서버 프로세스 시작"""
-        print("🚀 MCP 서버 시작 중...")
+    async def start_server(self, ready_timeout: float = 10.0) -> Dict[str, Any]:
+        """MCP 서버 프로세스 시작 후 준비 완료 알림(notifications/ready)까지 대기"""
+        self._log("🚀 MCP 서버 시작 중...")
+        start_time = time.perf_counter()
         self.server_process = await asyncio.create_subprocess_exec(
             *self.server_command,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE
+            stderr=None,  # 서버 로그는 stderr로 그대로 출력
+            limit=self.stream_limit
         )
         
-        # 서버가 준비될 때까지 잠시 대기
-        await asyncio.sleep(1)
-        print("✅ MCP 서버가 준비되었습니다.")
+        # 고정 대기 대신 서버가 카탈로그를 로드하고 보내는 준비 알림을 기다림
+        try:
+            ready = await asyncio.wait_for(self._wait_ready(), ready_timeout)
+        except (asyncio.TimeoutError, RuntimeError):
+            await self.close()
+            raise RuntimeError(f"MCP 서버가 {ready_timeout}초 안에 준비되지 않았습니다")
+        
+        self._log(f"✅ MCP 서버가 준비되었습니다. ({(time.perf_counter() - start_time) * 1000:.0f}ms, "
+                  f"문서 {ready.get('documents', 0)}개, 스냅샷 {'사용' if ready.get('snapshot') else '미사용'})")
+        return ready
+        
+    async def _wait_ready(self) -> Dict[str, Any]:
+        """준비 알림이 올 때까지 stdout 읽기 (JSON이 아닌 줄은 무시)"""
+        while True:
+            line = await self.server_process.stdout.readline()
+            if not line:
+                raise RuntimeError("MCP 서버가 준비 전에 종료되었습니다")
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, dict) and message.get("method") == "notifications/ready":
+                return message.get("params", {})
+        
+    async def _write_message(self, message: Dict[str, Any]):
+        """요청 하나를 stdin에 한 줄로 기록"""
+        self.server_process.stdin.write((json.dumps(message) + "\n").encode())
+        await self.server_process.stdin.drain()
+        
+    async def _read_message(self) -> Dict[str, Any]:
+        """stdout에서 메시지 한 줄 읽기"""
+        try:
+            line = await self.server_process.stdout.readline()
+        except ValueError:
+            # 한도를 넘은 줄은 스트림에서 일부만 소비되어 이후 메시지를 신뢰할 수 없음
+            raise ConnectionError(f"MCP 서버 응답 줄이 읽기 한도({self.stream_limit}바이트)를 넘었습니다")
+        if not line:
+            raise ConnectionError("MCP 서버 연결이 끊어졌습니다")
+        return json.loads(line.decode().strip())
+        
+    async def _read_response(self, request_id: int) -> Dict[str, Any]:
+        """요청 id와 일치하는 응답이 올 때까지 읽기 (알림은 건너뛰고 청크 응답은 재조립)"""
+        while True:
+            response = self.chunks.feed(await self._read_message())
+            if response is not None and response.get("id") == request_id:
+                return response
         
     async def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
         """MCP 서버에 JSON-RPC 요청 전송"""
@@ -45,23 +118,36 @@ class RealMCPServerClient:
         }
         
         # 요청 전송
-        request_json = json.dumps(request)
-        print(f"📤 요청 전송: {method}")
-        print(f"   파라미터: {params}")
+        self._log(f"📤 요청 전송: {method}")
+        self._log(f"   파라미터: {params}")
         
-        self.server_process.stdin.write((request_json + "\n").encode())
-        await self.server_process.stdin.drain()
+        await self._write_message(request)
         
         # 응답 수신
-        response_line = await self.server_process.stdout.readline()
-        response = json.loads(response_line.decode().strip())
+        response = await self._read_response(request["id"])
         
-        print(f"📥 응답 수신: {response.get('result', {}).get('summary', 'N/A')}")
+        self._log(f"📥 응답 수신: {response.get('result', {}).get('summary', 'N/A')}")
         return response
         
-    async def list_tools(self) -> List[Dict[str, Any]]:
-        """사용 가능한 도구 목록 조회"""
-        response = await self.send_request("tools/list")
+    async def list_tools(self, names_only: bool = False, page_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """사용 가능한 도구 목록 조회 (nextCursor를 따라 모든 페이지 수집)"""
+        tools = []
+        cursor = None
+        while True:
+            params = {"names_only": names_only}
+            if cursor:
+                params["cursor"] = cursor
+            if page_size:
+                params["limit"] = page_size
+            result = (await self.send_request("tools/list", params)).get("result", {})
+            tools.extend(result.get("tools", []))
+            cursor = result.get("nextCursor")
+            if not cursor:
+                return tools
+        
+    async def describe_tools(self, names: List[str]) -> List[Dict[str, Any]]:
+        """지정한 도구의 전체 스키마 조회"""
+        response = await self.send_request("tools/describe", {"names": names})
         return response.get("result", {}).get("tools", [])
         
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
@@ -71,38 +157,380 @@ class RealMCPServerClient:
             "arguments": arguments
         })
         
+    async def ping(self) -> bool:
+        """서버 응답 확인 (헬스 체크)"""
+        response = await self.send_request("ping")
+        return "error" not in response
+        
     async def close(self):
         """서버 연결 종료"""
         if self.server_process:
-            self.server_process.terminate()
+            if self.server_process.returncode is None:
+                self.server_process.terminate()
             await self.server_process.wait()
-            print("🔌 MCP 서버 연결 종료")
+            self._log("🔌 MCP 서버 연결 종료")
+
+
+class SocketMCPClient(RealMCPServerClient):
+    """
+    이미 실행 중인 MCP 서버에 Unix 도메인 소켓 또는 localhost TCP로 연결하는 클라이언트
+    (프로세스를 띄우지 않으며, 요청 API는 RealMCPServerClient와 동일)
+    """
+    
+    def __init__(self, path: Optional[str] = None, host: str = "127.0.0.1",
+                 port: Optional[int] = None, verbose: bool = True):
+        if (path is None) == (port is None):
+            raise ValueError("Specify exactly one of path or port")
+        super().__init__([], verbose)
+        self.path = path
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+        
+    @property
+    def alive(self) -> bool:
+        return self.writer is not None and not self.writer.is_closing()
+        
+    async def connect(self):
+        if self.path is not None:
+            self.reader, self.writer = await asyncio.open_unix_connection(self.path)
+        else:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self._log(f"🔗 MCP 서버 연결: {self.path or f'{self.host}:{self.port}'}")
+        
+    async def _write_message(self, message: Dict[str, Any]):
+        await write_frame(self.writer, message)
+        
+    async def _read_message(self) -> Dict[str, Any]:
+        message = await read_frame(self.reader)
+        if message is None:
+            raise ConnectionError("MCP 서버 연결이 끊어졌습니다")
+        return message
+        
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            with contextlib.suppress(ConnectionError):
+                await self.writer.wait_closed()
+            self.writer = None
+            self._log("🔌 MCP 서버 연결 종료")
+
+
+class PooledWorker:
+    """풀에 속한 서버 프로세스 하나와 부하 분산용 카운터"""
+    
+    def __init__(self, index: int, server_command: List[str]):
+        self.index = index
+        self.client = RealMCPServerClient(server_command, verbose=False)
+        self.lock = asyncio.Lock()  # 프로세스당 요청은 stdin/stdout 순서대로 하나씩
+        self.in_flight = 0
+        self.calls = 0
+        self.restarts = 0
+        
+    def stats(self) -> Dict[str, Any]:
+        process = self.client.server_process
+        return {
+            "index": self.index,
+            "pid": process.pid if process else None,
+            "alive": self.client.alive,
+            "in_flight": self.in_flight,
+            "calls": self.calls,
+            "restarts": self.restarts
+        }
+
+
+class PoolSession:
+    """풀의 워커 하나에 고정된 세션"""
+    
+    def __init__(self, pool: "MCPServerPool", worker: PooledWorker):
+        self.pool = pool
+        self.worker = worker
+        
+    async def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        return await self.pool._send(self.worker, method, params)
+        
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.send_request("tools/call", {"name": tool_name, "arguments": arguments})
+
+
+class MCPServerPool:
+    """
+    워밍된 MCP 서버 프로세스 N개를 유지하는 클라이언트 측 풀
+    - 진행 중 요청 수(in-flight)가 가장 적은 워커로 부하 분산
+    - 주기적 ping 헬스 체크, 종료되거나 응답이 없는 워커는 재시작
+    - 세션(session())은 워커를 빌려 쓰고 반환하므로 프로세스는 세션 간에 재사용됨
+    """
+    
+    def __init__(self, server_command: List[str], size: int = 4, health_interval: float = 5.0,
+                 request_timeout: float = 30.0, ready_timeout: float = 10.0):
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.server_command = server_command
+        self.health_interval = health_interval
+        self.request_timeout = request_timeout
+        self.ready_timeout = ready_timeout
+        self.workers = [PooledWorker(i, server_command) for i in range(size)]
+        self._health_task: Optional[asyncio.Task] = None
+        
+    async def start(self) -> "MCPServerPool":
+        """모든 워커를 동시에 시작하고 헬스 체크 태스크 실행 (하나라도 실패하면 모두 종료 후 예외 전파)"""
+        results = await asyncio.gather(
+            *(worker.client.start_server(self.ready_timeout) for worker in self.workers),
+            return_exceptions=True)
+        errors = [result for result in results if isinstance(result, BaseException)]
+        if errors:
+            await asyncio.gather(*(worker.client.close() for worker in self.workers))
+            raise errors[0]
+        if self.health_interval and self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+        print(f"✅ MCP 서버 풀 준비 완료: 워커 {len(self.workers)}개")
+        return self
+        
+    async def __aenter__(self) -> "MCPServerPool":
+        return await self.start()
+        
+    async def __aexit__(self, *exc_info):
+        await self.close()
+        
+    def _pick(self) -> PooledWorker:
+        """진행 중 요청이 가장 적은 워커 선택 (동률이면 누적 호출이 적은 쪽)"""
+        return min(self.workers, key=lambda worker: (worker.in_flight, worker.calls))
+        
+    async def _restart(self, worker: PooledWorker):
+        """워커 프로세스 재시작 (호출자는 worker.lock을 보유)"""
+        print(f"♻️ MCP 서버 워커 {worker.index} 재시작", file=sys.stderr)
+        await worker.client.close()
+        await worker.client.start_server(self.ready_timeout)
+        worker.restarts += 1
+        
+    async def _send(self, worker: PooledWorker, method: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        worker.in_flight += 1
+        try:
+            async with worker.lock:
+                if not worker.client.alive:
+                    await self._restart(worker)
+                try:
+                    return await asyncio.wait_for(
+                        worker.client.send_request(method, params), self.request_timeout)
+                except (ConnectionError, asyncio.TimeoutError, ValueError):
+                    # 프로세스가 죽었거나 응답 스트림이 깨진 경우: 재시작 후 한 번만 재시도
+                    await self._restart(worker)
+                    return await asyncio.wait_for(
+                        worker.client.send_request(method, params), self.request_timeout)
+        finally:
+            worker.in_flight -= 1
+            worker.calls += 1
+            
+    async def send_request(self, method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        return await self._send(self._pick(), method, params)
+        
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.send_request("tools/call", {"name": tool_name, "arguments": arguments})
+        
+    @contextlib.asynccontextmanager
+    async def session(self):
+        """
+        한 작업 동안 같은 워커를 사용하는 세션 (서버 프로세스의 읽기/검색 캐시 재사용)
+        세션이 끝나도 프로세스는 종료하지 않고 풀에 남음
+        세션 동안 워커의 진행 중 요청 수에 포함되어 다른 호출은 덜 바쁜 워커로 분산됨
+        """
+        worker = self._pick()
+        worker.in_flight += 1
+        try:
+            yield PoolSession(self, worker)
+        finally:
+            worker.in_flight -= 1
+        
+    async def check_health(self):
+        """유휴 워커에 ping을 보내고, 종료되었거나 응답하지 않는 워커 재시작"""
+        for worker in self.workers:
+            if worker.in_flight:
+                continue  # 요청 처리 중인 워커는 요청 경로에서 장애를 감지
+            async with worker.lock:
+                try:
+                    healthy = worker.client.alive and await asyncio.wait_for(
+                        worker.client.ping(), self.ready_timeout)
+                except (ConnectionError, asyncio.TimeoutError, ValueError):
+                    healthy = False
+                if not healthy:
+                    try:
+                        await self._restart(worker)
+                    except RuntimeError as e:
+                        print(f"⚠️ MCP 서버 워커 {worker.index} 재시작 실패: {e}", file=sys.stderr)
+        
+    async def _health_loop(self):
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self.check_health()
+            
+    def stats(self) -> List[Dict[str, Any]]:
+        return [worker.stats() for worker in self.workers]
+        
+    async def close(self):
+        """헬스 체크 중지 후 모든 워커 종료"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._health_task
+            self._health_task = None
+        await asyncio.gather(*(worker.client.close() for worker in self.workers))
+        print("🔌 MCP 서버 풀 종료")
+
+
+class ReadCache:
+    """메모리 상한(바이트)이 있는 LRU 파일 내용 캐시"""
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # key → (size, mtime_ns, content)
+        
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+        
+    def get(self, key: str, size: int, mtime_ns: int) -> Optional[str]:
+        """파일 지문(크기, mtime)이 일치할 때만 캐시된 내용 반환"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != size or entry[1] != mtime_ns:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[2]
+        
+    def put(self, key: str, size: int, mtime_ns: int, content: str) -> bool:
+        """상한을 넘으면 오래된 항목부터 제거. 단일 항목이 상한보다 크면 저장하지 않음"""
+        if size > self.max_bytes:
+            return False
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.current_bytes -= old[0]
+        while self._entries and self.current_bytes + size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted[0]
+        self._entries[key] = (size, mtime_ns, content)
+        self.current_bytes += size
+        return True
+        
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
 
 
 class SimpleFileMCPServer:
     """간단한 파일 시스템 MCP 서버 (데모용)"""
     
-    def __init__(self, work_dir: str):
+    tools = TOOLS
+    
+    def __init__(self, work_dir: str, prefetch_top_n: int = 0,
+                 read_cache_bytes: int = 4 * 1024 * 1024,
+                 profile_threshold: Optional[float] = None, profile_mode: str = "cprofile",
+                 storage: str = "files", codec: str = "zlib", shards: int = 0,
+                 max_frame_bytes: int = DEFAULT_MAX_FRAME_BYTES,
+                 write_queue_size: int = DEFAULT_WRITE_QUEUE_SIZE):
+        """
+        prefetch_top_n: 검색 직후 상위 N개 결과를 읽기 캐시에 미리 로드 (0이면 비활성)
+        read_cache_bytes: 읽기 캐시 메모리 상한
+        profile_threshold: 지정하면 이 시간(초)보다 느린 호출의 프로파일을 work_dir/profiles/에 저장
+        profile_mode: "cprofile" 또는 "sample"
+        storage: "files"(문서별 .txt 파일) 또는 "packed"(압축 세그먼트 + 오프셋 인덱스)
+        codec: packed 저장소 압축 방식 ("zlib" 또는 "zstd")
+        shards: 1 이상이면 work_dir/shard_XX/ 샤드에 분산된 문서를 동시 검색 (files 저장 방식만)
+        max_frame_bytes: stdio 응답 한 줄의 최대 크기 (넘으면 notifications/chunk 메시지로 분할)
+        write_queue_size: stdout 쓰기 큐에 쌓아둘 최대 프레임 수 (가득 차면 응답 생산자가 대기)
+        """
+        if storage not in ("files", "packed"):
+            raise ValueError(f"Unknown storage: {storage} (allowed: files, packed)")
+        if shards and storage != "files":
+            raise ValueError("shards requires storage='files'")
         self.work_dir = Path(work_dir)
+        self.profiler = (CallProfiler(self.work_dir / "profiles", profile_threshold, profile_mode)
+                         if profile_threshold is not None else None)
+        self.store = PackedDocumentStore(self.work_dir, codec) if storage == "packed" else None
+        self.shards = None
+        if shards:
+            from sharded_workspace import ShardedWorkspace
+            self.shards = ShardedWorkspace(self.work_dir, shards)
+        self._catalog = None
+        self.prefetch_top_n = prefetch_top_n
+        self.read_cache = ReadCache(read_cache_bytes)
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._prefetching: Dict[str, asyncio.Future] = {}  # 프리페치 예정/진행 중인 경로 → 완료 신호
+        self.trigram_index = TrigramIndex()  # regex / patterns 검색 시 처음 구성
+        self.max_frame_bytes = max_frame_bytes
+        self.write_queue_size = write_queue_size
+        self._output: Optional[BoundedWriter] = None  # run() 동안의 stdout 쓰기 큐
         
-    async def run(self):
-        """MCP 서버로 동작"""
-        print("📁 파일 시스템 MCP 서버 시작...")
+    @property
+    def catalog(self):
+        """문서 카탈로그 (메타데이터 도구가 처음 호출될 때 생성)"""
+        if self._catalog is None and self.shards is not None:
+            self._catalog = self.shards.catalog
+        elif self._catalog is None:
+            from workspace_catalog import WorkspaceCatalog
+            self._catalog = WorkspaceCatalog(self.work_dir, store=self.store)
+        return self._catalog
         
-        while True:
+    def close(self):
+        """샤드 검색 스레드 풀과 패킹 저장소 파일 핸들 정리"""
+        if self.shards is not None:
+            self.shards.close()
+        if self.store is not None:
+            self.store.close()
+        
+    def warm_up(self) -> Dict[str, Any]:
+        """
+        부팅 시 카탈로그 로드
+        스냅샷이 유효하면(문서별 stat 지문 일치) 복원하고, 아니면 스캔한 뒤 다음 부팅을 위해 스냅샷 저장
+        (어느 쪽이든 문서마다 stat은 한 번뿐)
+        """
+        start_time = time.perf_counter()
+        snapshot = self.catalog.load_snapshot()
+        if not snapshot:
+            self.catalog.refresh(force=True)
             try:
-                # 표준 입력에서 JSON-RPC 요청 읽기
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
-                if not line:
-                    break
-                    
-                request = json.loads(line.strip())
-                method = request.get("method")
-                params = request.get("params", {})
-                request_id = request.get("id")
-                
+                self.catalog.save_snapshot()
+            except OSError as e:
+                print(f"⚠️ 카탈로그 스냅샷 저장 실패: {e}", file=sys.stderr)
+        return {
+            "documents": self.catalog.document_count,
+            "snapshot": snapshot,
+            "warmup_ms": round((time.perf_counter() - start_time) * 1000, 3)
+        }
+    
+    def _encode_line(self, message: Dict[str, Any]) -> List[bytes]:
+        return encode_line_frames(message, self.max_frame_bytes)
+        
+    async def _write_frames(self, frames: List[bytes]):
+        """프레임을 stdout 쓰기 큐에 추가 (큐가 가득 차면 대기)"""
+        for frame in frames:
+            await self._output.send(frame)
+        
+    async def _send_notification(self, method: str, params: Dict[str, Any]):
+        """JSON-RPC 알림 전송 (id 없음)"""
+        await self._write_frames(self._encode_line({"jsonrpc": "2.0", "method": method, "params": params}))
+        
+    async def respond(self, request: Dict[str, Any], encode: Callable[[Dict[str, Any]], Any],
+                      write: Callable[[Any], Awaitable[None]]):
+        """JSON-RPC 요청 하나를 처리하고 응답 전송 (전송 방식은 encode/write로 주입)"""
+        if not isinstance(request, dict):
+            # 배치 배열 등 객체가 아닌 요청은 지원하지 않음
+            await write(encode({"jsonrpc": "2.0", "id": None,
+                                "error": {"code": -32600, "message": "Invalid Request: expected a JSON object"}}))
+            return
+        method = request.get("method")
+        params = request.get("params", {})
+        request_id = request.get("id")
+        try:
+            with self._profile_call(method, params):
                 # 요청 처리
                 result = await self.handle_request(method, params)
                 
@@ -113,93 +541,217 @@ class SimpleFileMCPServer:
                     "result": result
                 }
                 
-                print(json.dumps(response), flush=True)
+                with span(self.profiler, "serialize"):
+                    data = encode(response)
+                with span(self.profiler, "write"):
+                    await write(data)
                 
+        except Exception as e:
+            error_response = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": e.code if isinstance(e, InvalidParams) else -1, "message": str(e)}
+            }
+            await write(encode(error_response))
+        
+    async def run(self):
+        """MCP 서버로 동작 (stdout은 프로토콜 전용, 로그는 stderr)"""
+        print("📁 파일 시스템 MCP 서버 시작...", file=sys.stderr)
+        
+        # 응답은 크기 제한 큐를 거쳐 드레인 태스크가 기록 (느린 소비자가 요청 처리를 막지 않음)
+        self._output = BoundedWriter(await open_stdout_writer(), self.write_queue_size)
+        
+        # 카탈로그 준비 후 클라이언트에 준비 완료 알림
+        ready = await asyncio.to_thread(self.warm_up)
+        await self._send_notification("notifications/ready", ready)
+        
+        # 요청마다 태스크로 처리하여 큰 응답(청크 분할)이 다른 응답을 붙잡지 않도록 함
+        pending = set()
+        
+        async def handle(request: Dict[str, Any]):
+            try:
+                await self.respond(request, self._encode_line, self._write_frames)
+            except ConnectionError as e:
+                print(f"⚠️ 응답 전송 실패: {e}", file=sys.stderr)
             except Exception as e:
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": request.get("id"),
-                    "error": {"code": -1, "message": str(e)}
-                }
-                print(json.dumps(error_response), flush=True)
+                # 태스크 예외가 관찰되지 않은 채 사라지지 않도록 해당 id로 내부 오류 응답
+                print(f"⚠️ 요청 처리 실패: {e!r}", file=sys.stderr)
+                request_id = request.get("id") if isinstance(request, dict) else None
+                with contextlib.suppress(ConnectionError):
+                    await self._write_frames(self._encode_line({
+                        "jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": -32603, "message": f"Internal error: {e}"}}))
+        
+        while True:
+            # 표준 입력에서 JSON-RPC 요청 읽기
+            line = await asyncio.get_event_loop().run_in_executor(
+                None, sys.stdin.readline
+            )
+            if not line:
+                break
+            
+            try:
+                request = json.loads(line.strip())
+            except ValueError as e:
+                await self._write_frames(self._encode_line(
+                    {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": str(e)}}))
+                continue
+            task = asyncio.create_task(handle(request))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        
+        # 입력이 끝나면 처리 중인 요청과 남은 출력을 모두 내보낸 뒤 종료
+        if pending:
+            await asyncio.gather(*pending)
+        await self._output.close()
+    
+    async def serve_socket(self, path: Optional[str] = None, host: str = "127.0.0.1",
+                           port: Optional[int] = None):
+        """
+        Unix 도메인 소켓(path) 또는 localhost TCP(port)로 동작
+        여러 클라이언트가 하나의 서버(워밍된 캐시)를 공유하며, 메시지는 길이 접두사 프레임으로 교환
+        """
+        if (path is None) == (port is None):
+            raise ValueError("Specify exactly one of path or port")
+        ready = await asyncio.to_thread(self.warm_up)
+        
+        async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+            async def write(data: bytes):
+                writer.write(data)
+                await writer.drain()
+            
+            try:
+                while True:
+                    try:
+                        request = await read_frame(reader)
+                    except PayloadError as e:
+                        # 프레임 경계는 유지되므로 파싱 오류만 응답하고 연결은 유지
+                        await write(encode_frame(
+                            {"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": str(e)}}))
+                        continue
+                    if request is None:
+                        break
+                    await self.respond(request, encode_frame, write)
+            except (FrameError, ConnectionError, asyncio.IncompleteReadError) as e:
+                print(f"⚠️ 연결 종료: {e}", file=sys.stderr)
+            finally:
+                writer.close()
+                with contextlib.suppress(ConnectionError):
+                    await writer.wait_closed()
+        
+        if path is not None:
+            await self._remove_stale_socket(path)
+            server = await asyncio.start_unix_server(handle_connection, path=path)
+            address = path
+        else:
+            server = await asyncio.start_server(handle_connection, host=host, port=port)
+            address = f"{host}:{server.sockets[0].getsockname()[1]}"
+        
+        print(f"📁 파일 시스템 MCP 서버 시작: {address} (문서 {ready['documents']}개)", file=sys.stderr)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if path is not None:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(path)
+    
+    @staticmethod
+    async def _remove_stale_socket(path: str):
+        """
+        이전 실행이 남긴 소켓 파일만 제거
+        소켓이 아닌 파일이면 덮어쓰지 않고, 연결이 되는(살아 있는 서버의) 소켓이면 가로채지 않음
+        """
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return
+        if not S_ISSOCK(mode):
+            raise FileExistsError(errno.EEXIST, "Path exists and is not a socket", path)
+        try:
+            _, writer = await asyncio.open_unix_connection(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+            return
+        writer.close()
+        raise OSError(errno.EADDRINUSE, "Another MCP server is listening on this socket", path)
     
     async def handle_request(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """MCP 요청 처리"""
         if method == "tools/list":
-            return {
-                "tools": [
-                    {
-                        "name": "search_files",
-                        "description": "파일 시스템에서 파일 검색",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "query": {"type": "string"},
-                                "max_results": {"type": "integer", "default": 10}
-                            },
-                            "required": ["query"]
-                        }
-                    },
-                    {
-                        "name": "read_file",
-                        "description": "파일 내용 읽기",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "path": {"type": "string"}
-                            },
-                            "required": ["path"]
-                        }
-                    },
-                    {
-                        "name": "list_directory",
-                        "description": "디렉토리 내용 목록",
-                        "inputSchema": {
-                            "type": "object",
-                            "properties": {
-                                "path": {"type": "string", "default": "."}
-                            },
-                            "required": []
-                        }
-                    }
-                ]
-            }
+            # 페이지네이션(cursor/limit)과 이름만 조회(names_only) 지원
+            return self.tools.list(
+                params.get("cursor"),
+                params.get("limit"),
+                params.get("names_only", False)
+            )
+            
+        elif method == "ping":
+            # 클라이언트 풀의 헬스 체크
+            return {}
+            
+        elif method == "tools/describe":
+            # 에이전트가 실제로 사용할 도구의 전체 스키마만 조회
+            return self.tools.describe(params.get("names", []))
             
         elif method == "tools/call":
             tool_name = params.get("name")
             arguments = params.get("arguments", {})
-            
-            if tool_name == "search_files":
-                return await self.search_files(
-                    arguments.get("query", ""),
-                    arguments.get("max_results", 10)
-                )
-            elif tool_name == "read_file":
-                return await self.read_file(arguments.get("path"))
-            elif tool_name == "list_directory":
-                return await self.list_directory(arguments.get("path", "."))
-            else:
-                raise ValueError(f"Unknown tool: {tool_name}")
+            with self._profile_call(method, params):
+                return await self.tools.call(self, tool_name, arguments)
         
         return {"error": "Unknown method"}
     
-    async def search_files(self, query: str, max_results: int = 10) -> Dict[str, Any]:
+    def _profile_call(self, method: str, params: Dict[str, Any]):
+        """프로파일링이 켜져 있을 때만 호출 단위 프로파일 컨텍스트 반환"""
+        if self.profiler is None:
+            return contextlib.nullcontext()
+        if method == "tools/call":
+            return self.profiler.call(params.get("name") or method, params.get("arguments", {}))
+        return self.profiler.call(method or "unknown", params)
+    
+    @TOOLS.tool("search_files", "파일 시스템에서 파일 검색 (이름 부분 문자열, 정규식, 다중 키워드)", {
+        "type": "object",
+        "properties": {
+            "query": {"type": "string", "description": "파일 이름 부분 문자열"},
+            "regex": {"type": "string", "description": "파일 이름/내용에 적용할 정규식"},
+            "patterns": {"type": "array", "items": {"type": "string"},
+                         "description": "파일 이름/내용에서 찾을 키워드 (하나라도 일치, 대소문자 무시)"},
+            "max_results": {"type": "integer", "default": 10}
+        },
+        "required": []
+    })
+    async def search_files(self, query: str = "", max_results: int = 10,
+                           regex: Optional[str] = None, patterns: Optional[List[str]] = None) -> Dict[str, Any]:
         """파일 검색 구현"""
-        import time
-        import os
+        if regex is not None or patterns:
+            return await self.search_patterns(regex, patterns, max_results)
         
         # 캐시 시뮬레이션 (실제 MCP 서버에서는 Redis 등 사용)
         cache_key = f"search_{hash(query)}_{max_results}"
-        print(f"🔍 검색 실행: {query}")
-        print(f"   캐시 키: {cache_key}")
+        print(f"🔍 검색 실행: {query}", file=sys.stderr)
+        print(f"   캐시 키: {cache_key}", file=sys.stderr)
         
         # 실제 파일 시스템 검색
         results = []
         try:
-            for file_path in self.work_dir.glob("*.txt"):
-                if query.lower() in file_path.name.lower():
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
+            if self.shards is not None:
+                # 샤드별 동시 검색(파일 이름 기준) 후 상위 max_results개 병합
+                for hit in await self.shards.search_async(query, max_results, match_content=False):
+                    results.append({
+                        "path": hit.meta.path,
+                        "name": hit.meta.name,
+                        "size": hit.length,
+                        "content": hit.head[:200] + "..." if hit.length > 200 else hit.head
+                    })
+            else:
+                for file_path in self._document_paths():
+                    with span(self.profiler, "match"):
+                        matched = query.lower() in file_path.name.lower()
+                    if matched:
+                        with span(self.profiler, "read"):
+                            _, _, content = self._load(str(file_path))
                         results.append({
                             "path": str(file_path),
                             "name": file_path.name,
@@ -208,32 +760,182 @@ class SimpleFileMCPServer:
                         })
                         if len(results) >= max_results:
                             break
-                            
+                        
             time.sleep(0.01)  # 실제 디스크 I/O 시뮬레이션
             
         except Exception as e:
             return {"error": f"Search failed: {str(e)}"}
             
+        self.schedule_prefetch([result["path"] for result in results])
+        
         return {
             "summary": f"Found {len(results)} files matching '{query}'",
             "results": results,
             "cache_info": {"key": cache_key, "ttl": 300}  # 5분 TTL
         }
     
+    async def search_patterns(self, regex: Optional[str], patterns: Optional[List[str]],
+                              max_results: int = 10) -> Dict[str, Any]:
+        """
+        정규식 또는 다중 키워드 검색
+        트라이그램 인덱스로 필수 리터럴을 포함할 수 있는 후보만 고른 뒤, 후보 파일마다 한 번만 스캔
+        (키워드는 Aho-Corasick 오토마톤 하나로 동시에 검사)
+        """
+        try:
+            if regex is not None:
+                compiled = re.compile(regex)
+                literals = required_literals(regex, compiled.flags)
+                automaton = None
+            else:
+                compiled = None
+                automaton = AhoCorasick(patterns)
+                literals = automaton.patterns
+        except (re.error, ValueError) as e:
+            return {"error": f"Invalid pattern: {e}"}
+        print(f"🔍 패턴 검색 실행: {regex if regex is not None else patterns}", file=sys.stderr)
+        
+        try:
+            paths = self._all_document_paths()
+            with span(self.profiler, "index"):
+                await asyncio.to_thread(self.trigram_index.refresh, paths, self._fingerprint,
+                                        lambda path: self._load(path)[2])
+            candidates = (self.trigram_index.candidates_all(literals) if compiled is not None
+                          else self.trigram_index.candidates_any(literals))
+            if candidates is not None:
+                paths = [path for path in paths if path in candidates]
+            
+            results = []
+            for path in paths:
+                name = Path(path).name
+                with span(self.profiler, "read"):
+                    _, _, content = self._load(path)
+                with span(self.profiler, "match"):
+                    if compiled is not None:
+                        found = compiled.search(name) or compiled.search(content)
+                        matched = {"match": found.group(0)} if found else None
+                    else:
+                        counts = automaton.matches(name + "\n" + content)
+                        matched = {"matches": counts} if counts else None
+                if matched:
+                    results.append(dict({
+                        "path": path,
+                        "name": name,
+                        "size": len(content),
+                        "content": content[:200] + "..." if len(content) > 200 else content
+                    }, **matched))
+                    if len(results) >= max_results:
+                        break
+        except Exception as e:
+            return {"error": f"Search failed: {str(e)}"}
+        
+        self.schedule_prefetch([result["path"] for result in results])
+        
+        return {
+            "summary": f"Found {len(results)} files matching {'regex' if compiled is not None else 'patterns'}",
+            "results": results,
+            "candidates": len(paths),
+            "indexed": len(self.trigram_index)
+        }
+    
+    def _all_document_paths(self) -> List[str]:
+        """모든 저장 방식(파일, 패킹, 샤딩)의 문서 경로 목록"""
+        if self.shards is not None:
+            return [meta.path for meta in self.shards.catalog.query()]
+        return sorted(str(path) for path in self._document_paths())
+    
+    def schedule_prefetch(self, paths: List[str]):
+        """
+        이전 프리페치를 취소하고 새 검색 결과의 상위 N개를 백그라운드로 로드
+        read_file은 프리페치 예정인 경로를 직접 읽지 않고 해당 로드가 끝나기를 기다림
+        """
+        if self.prefetch_top_n <= 0:
+            return
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        loop = asyncio.get_running_loop()
+        self._prefetching = {path: loop.create_future() for path in paths[:self.prefetch_top_n]
+                             if path not in self.read_cache}
+        self._prefetch_task = asyncio.create_task(self._prefetch(self._prefetching))
+    
+    async def _prefetch(self, pending: Dict[str, asyncio.Future]):
+        """프리페치 작업 (파일마다 취소 지점 존재, 끝나거나 취소되면 대기 중인 read_file을 깨움)"""
+        try:
+            for path, done in pending.items():
+                try:
+                    size, mtime_ns, content = await asyncio.to_thread(self._load, path)
+                    self.read_cache.put(path, size, mtime_ns, content)
+                except (OSError, UnicodeDecodeError):
+                    pass
+                done.set_result(None)
+        finally:
+            for done in pending.values():
+                if not done.done():
+                    done.set_result(None)
+    
+    def _document_paths(self):
+        """문서 경로 순회 (packed 저장소는 인덱스만 사용)"""
+        if self.store is not None:
+            self.store.reload()
+            return [self.work_dir / name for name in self.store.entries()]
+        return self.work_dir.glob("*.txt")
+    
+    def _fingerprint(self, path: str):
+        """문서의 (크기, mtime_ns)"""
+        if self.store is not None:
+            entry = self.store.stat(Path(path).name)
+            if entry is None and self.store.reload():
+                entry = self.store.stat(Path(path).name)
+            if entry is None:
+                raise FileNotFoundError(f"No such document in packed store: {Path(path).name}")
+            return entry.size, entry.mtime_ns
+        stat = os.stat(path)
+        return stat.st_size, stat.st_mtime_ns
+    
+    def _load(self, path: str):
+        """문서의 (크기, mtime_ns, 내용). packed 저장소면 세그먼트에서 임의 접근"""
+        if self.store is not None:
+            size, mtime_ns = self._fingerprint(path)
+            return size, mtime_ns, self.store.get(Path(path).name)
+        with open(path, 'r', encoding='utf-8') as f:
+            stat = os.fstat(f.fileno())
+            return stat.st_size, stat.st_mtime_ns, f.read()
+    
+    @TOOLS.tool("read_file", "파일 내용 읽기", {
+        "type": "object",
+        "properties": {
+            "path": {"type": "string"}
+        },
+        "required": ["path"]
+    })
     async def read_file(self, path: str) -> Dict[str, Any]:
-        """파일 읽기 구현"""
+        """파일 읽기 구현 (프리페치된 내용이 있으면 메모리에서 반환)"""
         try:
-            file_path = self.work_dir / path
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            file_path = str(self.shards.resolve(path) if self.shards is not None else self.work_dir / path)
+            size, mtime_ns = self._fingerprint(file_path)
+            prefetching = self._prefetching.get(file_path)
+            if prefetching is not None and not prefetching.done():
+                await asyncio.shield(prefetching)
+            content = self.read_cache.get(file_path, size, mtime_ns)
+            cached = content is not None
+            if not cached:
+                with span(self.profiler, "read"):
+                    _, _, content = self._load(file_path)
             return {
                 "path": path,
                 "content": content,
-                "size": len(content)
+                "size": len(content),
+                "cached": cached
             }
         except Exception as e:
             return {"error": f"Read failed: {str(e)}"}
     
+    @TOOLS.tool("list_directory", "디렉토리 내용 목록", {
+        "type": "object",
+        "properties": {
+            "path": {"type": "string", "default": "."}
+        },
+        "required": []
+    })
     async def list_directory(self, path: str = ".") -> Dict[str, Any]:
         """디렉토리 목록 구현"""
         try:
@@ -255,6 +957,14 @@ class SimpleFileMCPServer:
             }
         except Exception as e:
             return {"error": f"List failed: {str(e)}"}
+    
+
+
+# 메타데이터 도구는 첫 호출 또는 스키마 요청 시에만 모듈을 import
+TOOLS.lazy("get_metadata", "문서 메타데이터 조회 (파일 내용을 읽지 않음)",
+           "metadata_tools:get_metadata")
+TOOLS.lazy("get_documents", "특정 문서의 요청 필드만 조회",
+           "metadata_tools:get_documents")
 
 
 async def demonstrate_real_mcp():
@@ -262,17 +972,23 @@ async def demonstrate_real_mcp():
     print("🎯 실제 MCP 서버 직접 호출 데모 시작")
     print("=" * 60)
     
-    # 실제 프로세스 분리 대신, 단순화된 데모
-    server = SimpleFileMCPServer("mcp_workspace")
+    # 1~5단계는 프로세스 분리 없이 단순화된 데모, 6단계는 실제 서버 프로세스와 통신
+    server = SimpleFileMCPServer("mcp_workspace", prefetch_top_n=3)
+    client = None
     
     try:
         # 1. 사용 가능한 도구 목록 조회
         print("\n📋 1. 사용 가능한 도구 목록 조회")
         print("-" * 40)
-        tools_response = await server.handle_request("tools/list", {})
+        tools_response = await server.handle_request("tools/list", {"names_only": True})
         for tool in tools_response["tools"]:
             print(f"   🔧 {tool['name']}: {tool['description']}")
         
+        # 사용할 도구의 스키마만 요청
+        schema_response = await server.handle_request("tools/describe", {"names": ["search_files"]})
+        for tool in schema_response["tools"]:
+            print(f"   📐 {tool['name']} 스키마: {json.dumps(tool['inputSchema'], ensure_ascii=False)}")
+        
         # 2. 디렉토리 목록 조회
         print("\n📁 2. 작업 디렉토리 목록 조회")
         print("-" * 40)
@@ -292,7 +1008,7 @@ async def demonstrate_real_mcp():
         search_result = await server.handle_request("tools/call", {
             "name": "search_files",
             "arguments": {
-                "query": "AI 기술",
+                "query": "AI_기술",
                 "max_results": 5
             }
         })
@@ -315,7 +1031,8 @@ async def demonstrate_real_mcp():
             
             if "error" not in file_result:
                 content = file_result["content"]
-                print(f"   📊 파일 크기: {file_result['size']} bytes")
+                source = "프리페치 캐시" if file_result.get("cached") else "디스크"
+                print(f"   📊 파일 크기: {file_result['size']} bytes ({source}에서 읽음)")
                 print(f"   📝 내용: {content[:200]}...")
         
         # 5. 캐시 테스트 (동일 검색 재시도)
@@ -324,7 +1041,7 @@ async def demonstrate_real_mcp():
         cached_result = await server.handle_request("tools/call", {
             "name": "search_files",
             "arguments": {
-                "query": "AI 기술",
+                "query": "AI_기술",
                 "max_results": 5
             }
         })
@@ -334,27 +1051,72 @@ async def demonstrate_real_mcp():
             print(f"   🎯 캐시 히트! 키: {cache_info.get('key', 'N/A')}")
             print(f"   ⚡ 결과: {cached_result['summary']}")
         
+        # 6. 실제 서버 프로세스 (준비 알림 핸드셰이크)
+        print("\n🔌 6. 실제 서버 프로세스와 통신")
+        print("-" * 40)
+        client = RealMCPServerClient([sys.executable, str(Path(__file__).resolve()), "--server-mode"])
+        await client.start_server()
+        metadata = await client.call_tool("get_metadata", {"limit": 3})
+        print(f"   📊 {metadata.get('result', {}).get('document_ids', [])}")
+        
+        # 7. 서버 프로세스 풀 (동시 호출 분산)
+        print("\n🏊 7. 서버 프로세스 풀로 동시 호출")
+        print("-" * 40)
+        async with MCPServerPool(client.server_command, size=2, health_interval=0) as pool:
+            queries = ["AI", "기술", "문서_00", "문서_01"]
+            results = await asyncio.gather(*(
+                pool.call_tool("search_files", {"query": query, "max_results": 3}) for query in queries
+            ))
+            for query, response in zip(queries, results):
+                print(f"   🔍 {query}: {response.get('result', {}).get('summary', 'N/A')}")
+            for worker in pool.stats():
+                print(f"   ⚙️ 워커 {worker['index']} (pid {worker['pid']}): {worker['calls']}회 호출")
+        
         print("\n✅ 실제 MCP 서버 호출 데모 완료!")
         
     except Exception as e:
         print(f"❌ 데모 실행 중 오류: {e}")
     finally:
-        await client.close()
+        if client is not None:
+            await client.close()
+        server.close()
 
 
 async def main():
     """메인 함수"""
     if len(sys.argv) > 1 and sys.argv[1] == "--server-mode":
-        # 서버 모드로 실행
-        await SimpleFileMCPServer("mcp_workspace").run()
+        # 서버 모드로 실행 (MCP_PROFILE_THRESHOLD 환경 변수로 느린 호출 프로파일링 활성화,
+        # MCP_STORAGE / MCP_CODEC / MCP_SHARDS로 저장 방식 선택)
+        profile_threshold = os.environ.get("MCP_PROFILE_THRESHOLD")
+        server = SimpleFileMCPServer(
+            "mcp_workspace",
+            profile_threshold=float(profile_threshold) if profile_threshold else None,
+            profile_mode=os.environ.get("MCP_PROFILE_MODE", "cprofile"),
+            storage=os.environ.get("MCP_STORAGE", "files"),
+            codec=os.environ.get("MCP_CODEC", "zlib"),
+            shards=int(os.environ.get("MCP_SHARDS", "0")),
+            max_frame_bytes=int(os.environ.get("MCP_MAX_FRAME_BYTES", DEFAULT_MAX_FRAME_BYTES))
+        )
+        # --unix PATH / --tcp PORT: stdio 대신 소켓 전송 사용
+        try:
+            if "--unix" in sys.argv:
+                await server.serve_socket(path=sys.argv[sys.argv.index("--unix") + 1])
+            elif "--tcp" in sys.argv:
+                await server.serve_socket(port=int(sys.argv[sys.argv.index("--tcp") + 1]))
+            else:
+                await server.run()
+        finally:
+            server.close()
     else:
         # 클라이언트 데모 모드로 실행
         await demonstrate_real_mcp()
 
 
 if __name__ == "__main__":
-    print("🚀 실제 MCP 서버 직접 호출 예제")
-    print("이것은 가상의 시뮬레이션이 아니라, 실제 MCP 서버와 통신합니다!")
-    print()
+    if "--server-mode" not in sys.argv:
+        # 서버 모드에서는 stdout을 JSON-RPC 전용으로 사용
+        print("🚀 실제 MCP 서버 직접 호출 예제")
+        print("이것은 가상의 시뮬레이션이 아니라, 실제 MCP 서버와 통신합니다!")
+        print()
     
     asyncio.run(main())
@@ -0,0 +1,62 @@
+"""
+간결한 레코드 타입
+카탈로그 엔트리와 실행 로그를 키 문자열이 반복되는 dict 대신 __slots__ 데이터클래스로 보관합니다.
+- 항목당 메모리와 GC 추적 대상 감소 (10만 건 이상에서 효과가 큼)
+- JSON 경계(응답, 내보내기)에서만 to_dict()로 변환
+"""
+
+import time
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Iterable, Optional
+
+
+@dataclass(slots=True)
+class DocumentMeta:
+    """카탈로그 문서 메타데이터 (stat 정보만 보관)"""
+    id: str
+    name: str
+    path: str
+    size: int
+    mtime: float
+    category: str
+
+    @property
+    def title(self) -> str:
+        return self.id.replace("_", " ")
+
+    @property
+    def modified(self) -> str:
+        return time.strftime('%Y-%m-%d', time.localtime(self.mtime))
+
+    def to_dict(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        if names is None:
+            names = ("id", "name", "title", "path", "size", "modified", "mtime", "category")
+        return {name: getattr(self, name) for name in names}
+
+
+@dataclass(slots=True)
+class LogEntry:
+    """실행 로그 항목 (해당 작업에 없는 값은 None으로 두고 dict 변환 시 생략)"""
+    action: str
+    execution_time: Optional[float] = None
+    query: Optional[str] = None
+    results_count: Optional[int] = None
+    document_count: Optional[int] = None
+    processed_count: Optional[int] = None
+    derived_hits: Optional[int] = None
+    timestamp: float = 0.0
+
+    def __post_init__(self):
+        if not self.timestamp:
+            self.timestamp = time.time()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {f.name: value for f in fields(self)
+                if (value := getattr(self, f.name)) is not None}
+
+
+def to_json(obj: Any) -> Any:
+    """json.dump(default=...)용 변환기: 레코드는 JSON 경계에서만 dict로 변환"""
+    if isinstance(obj, (DocumentMeta, LogEntry)):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
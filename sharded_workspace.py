@@ -0,0 +1,178 @@
+"""
+샤딩된 작업 공간
+문서를 이름 해시로 여러 샤드 디렉토리(다른 디스크도 가능)에 나누어 저장합니다.
+- 샤드마다 자체 카탈로그(인덱스)와 스냅샷을 가짐
+- 검색은 모든 샤드에 동시에 흩뿌린 뒤(scatter) 샤드별 상위 k개를 모아 병합(gather)
+  순위는 문서 이름 순이므로 샤드는 k개를 찾는 즉시 멈춤 (코퍼스가 커져도 지연 시간 유지)
+- ShardedCatalog는 샤드 카탈로그를 합친 뷰로, get_metadata / get_documents를 그대로 지원
+"""
+
+import asyncio
+import heapq
+import itertools
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from records import DocumentMeta
+from workspace_catalog import WorkspaceCatalog
+
+
+class SearchHit(NamedTuple):
+    meta: DocumentMeta
+    length: int         # 내용 글자 수
+    head: str           # 내용 앞부분 (미리보기용)
+
+
+HEAD_CHARS = 201
+
+
+def _rank(hit: SearchHit) -> str:
+    """병합 순서: 문서 이름 오름차순 (샤드 카탈로그 순서와 동일)"""
+    return hit.meta.name
+
+
+class ShardedCatalog(WorkspaceCatalog):
+    """샤드 카탈로그를 합친 읽기 전용 뷰 (질의 API는 WorkspaceCatalog와 동일)"""
+
+    def __init__(self, root: Path, shards: Sequence[WorkspaceCatalog], pattern: str = "*.txt"):
+        super().__init__(root, pattern)
+        self.shards = list(shards)
+        self._versions: Optional[Tuple] = None
+
+    def invalidate(self) -> None:
+        for shard in self.shards:
+            shard.invalidate()
+        self._versions = None
+
+    def refresh(self, force: bool = False) -> None:
+        """샤드별로 바뀐 디렉토리만 재스캔하고, 하나라도 바뀌었으면 다시 병합"""
+        for shard in self.shards:
+            shard.refresh(force)
+        versions = tuple(shard._dir_mtime_ns for shard in self.shards)
+        if not force and versions == self._versions:
+            return
+        self._merge()
+
+    def _merge(self) -> None:
+        """샤드 카탈로그 항목 병합 (샤드는 다시 stat하지 않음)"""
+        merged = {}
+        for shard in self.shards:
+            merged.update(shard._entries)
+        self._entries = dict(sorted(merged.items()))
+        self._versions = tuple(shard._dir_mtime_ns for shard in self.shards)
+
+    def save_snapshot(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """샤드마다 자체 디렉토리에 스냅샷 저장 (path는 무시)"""
+        for shard in self.shards:
+            shard.save_snapshot()
+        self._versions = tuple(shard._dir_mtime_ns for shard in self.shards)
+        return self.work_dir
+
+    def load_snapshot(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """모든 샤드 스냅샷이 유효할 때만 True (유효한 샤드는 그대로 복원)"""
+        loaded = [shard.load_snapshot() for shard in self.shards]
+        if not all(loaded):
+            return False
+        self._merge()
+        return True
+
+
+class ShardedWorkspace:
+    """이름 해시로 문서를 분산 저장하는 작업 공간"""
+
+    def __init__(self, root: Union[str, Path], shard_count: int = 4, pattern: str = "*.txt",
+                 shard_dirs: Optional[Iterable[Union[str, Path]]] = None):
+        """
+        shard_dirs를 지정하면 해당 디렉토리들을 샤드로 사용 (예: 디스크별 경로)
+        지정하지 않으면 root/shard_00 ... root/shard_{N-1}
+        """
+        self.root = Path(root)
+        self.pattern = pattern
+        if shard_dirs is not None:
+            self.shard_dirs = [Path(d) for d in shard_dirs]
+        else:
+            self.shard_dirs = [self.root / f"shard_{i:02d}" for i in range(shard_count)]
+        if not self.shard_dirs:
+            raise ValueError("shard_count must be >= 1")
+        for shard_dir in self.shard_dirs:
+            shard_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog = ShardedCatalog(
+            self.root, [WorkspaceCatalog(d, pattern) for d in self.shard_dirs], pattern)
+        self._executor = ThreadPoolExecutor(max_workers=len(self.shard_dirs),
+                                            thread_name_prefix="shard-search")
+
+    def __len__(self) -> int:
+        return len(self.catalog)
+
+    def shard_for(self, name: str) -> int:
+        """문서 이름의 샤드 번호 (crc32: 프로세스/실행과 무관하게 안정적)"""
+        return zlib.crc32(name.encode('utf-8')) % len(self.shard_dirs)
+
+    def path_for(self, name: str) -> Path:
+        return self.shard_dirs[self.shard_for(name)] / name
+
+    def resolve(self, path: str) -> Path:
+        """문서 이름만 주어지면 해당 샤드 경로로, 상대 경로면 root 기준으로 해석"""
+        if Path(path).name == path:
+            return self.path_for(path)
+        return self.root / path
+
+    def put_many(self, documents: Iterable[Tuple[str, str]]) -> int:
+        count = 0
+        for name, content in documents:
+            with open(self.path_for(name), 'w', encoding='utf-8') as f:
+                f.write(content)
+            count += 1
+        self.catalog.invalidate()
+        return count
+
+    def put(self, name: str, content: str) -> None:
+        self.put_many([(name, content)])
+
+    def search_shard(self, index: int, query: str, k: int, match_content: bool = True) -> List[SearchHit]:
+        """
+        샤드 하나를 이름 순으로 스캔하여 처음 일치하는 k개 반환 (검색 스레드에서 실행)
+        match_content=False면 파일 이름만 비교하고 일치한 문서만 읽음
+        """
+        query_lower = query.lower()
+        hits = []
+        for meta in self.catalog.shards[index].query():
+            name_matched = query_lower in meta.name.lower()
+            if not match_content and not name_matched:
+                continue
+            try:
+                with open(meta.path, 'r', encoding='utf-8') as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            if name_matched or query_lower in content.lower():
+                hits.append(SearchHit(meta, len(content), content[:HEAD_CHARS]))
+                if len(hits) >= k:
+                    break
+        return hits
+
+    @staticmethod
+    def merge(results: Iterable[List[SearchHit]], k: int) -> List[SearchHit]:
+        """이름 순으로 정렬된 샤드별 목록을 병합하여 전체 상위 k개 반환"""
+        return list(itertools.islice(heapq.merge(*results, key=_rank), k))
+
+    def search(self, query: str, max_results: int = 10, match_content: bool = True) -> List[SearchHit]:
+        """모든 샤드를 동시에 검색한 뒤 상위 max_results개 병합"""
+        futures = [self._executor.submit(self.search_shard, i, query, max_results, match_content)
+                   for i in range(len(self.shard_dirs))]
+        return self.merge((future.result() for future in futures), max_results)
+
+    async def search_async(self, query: str, max_results: int = 10,
+                           match_content: bool = True) -> List[SearchHit]:
+        """search()의 asyncio 버전 (이벤트 루프를 막지 않음)"""
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self._executor, self.search_shard, i, query, max_results, match_content)
+            for i in range(len(self.shard_dirs))
+        ))
+        return self.merge(results, max_results)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -2,12 +2,20 @@
 # 이 코드는 실제로 실행되며, 파일 시스템에서 문서를 검색하고 처리합니다
 
 import json
-import os
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
 import hashlib
 
+from adaptive_cache import AdaptiveCache
+from call_profiler import CallProfiler, profiled, span
+from records import LogEntry, to_json
+from execution_stats import ExecutionStats, is_batch, is_cached, is_search
+from derived_store import DERIVED_FILENAME, DerivedDataStore
+from packed_store import PackedDocumentStore
+from sharded_workspace import ShardedWorkspace
+from workspace_catalog import WorkspaceCatalog
+
 class RealMCPExample:
     """
     실제 동작하는 MCP 코드 실행 예제
@@ -17,13 +25,53 @@ class RealMCPExample:
     - 상태 지속성: 실행 결과 저장 및 재사용
     """
 
-    def __init__(self, work_dir: str = "./mcp_workspace"):
+    def __init__(self, work_dir: str = "./mcp_workspace", profile_threshold: Optional[float] = None,
+                 profile_mode: str = "cprofile", storage: str = "files", codec: str = "zlib",
+                 shards: int = 0):
+        """
+        profile_threshold: 지정하면 이 시간(초)보다 느린 호출의 프로파일을 work_dir/profiles/에 저장
+        profile_mode: "cprofile" 또는 "sample"
+        storage: "files"(문서별 .txt 파일) 또는 "packed"(압축 세그먼트 + 오프셋 인덱스)
+        codec: packed 저장소 압축 방식 ("zlib" 또는 "zstd")
+        shards: 1 이상이면 문서를 work_dir/shard_XX/ 디렉토리에 해시 분산 저장 (files 저장 방식만)
+        """
+        if storage not in ("files", "packed"):
+            raise ValueError(f"Unknown storage: {storage} (allowed: files, packed)")
+        if shards and storage != "files":
+            raise ValueError("shards requires storage='files'")
         self.work_dir = Path(work_dir)
         self.work_dir.mkdir(exist_ok=True)
-        self.execution_log = []
-        self.cache = {}
+        self.store = PackedDocumentStore(self.work_dir, codec) if storage == "packed" else None
+        self.profiler = (CallProfiler(self.work_dir / "profiles", profile_threshold, profile_mode)
+                         if profile_threshold is not None else None)
+        self.execution_log: List[LogEntry] = []
+        self.stats = ExecutionStats()  # 로그 추가 시 갱신되는 누적/시간 창 집계
+        self.cache = AdaptiveCache(max_entries=256)  # 비싸고 자주 찾는 검색 결과를 오래 유지
+        self.shards = ShardedWorkspace(self.work_dir, shards) if shards else None
+        self.catalog = (self.shards.catalog if self.shards is not None
+                        else WorkspaceCatalog(self.work_dir, store=self.store))
+        self._derived: Optional[DerivedDataStore] = None  # 첫 사용 시 로드 (지연 초기화)
         print(f"✅ MCP 작업 공간 초기화: {self.work_dir.absolute()}")
 
+    def close(self) -> None:
+        """샤드 검색 스레드 풀과 패킹 저장소 파일 핸들 정리"""
+        if self.shards is not None:
+            self.shards.close()
+        if self.store is not None:
+            self.store.close()
+
+    def _record(self, entry: LogEntry) -> None:
+        """실행 로그 기록 (집계도 함께 갱신)"""
+        self.execution_log.append(entry)
+        self.stats.record(entry)
+
+    @property
+    def derived(self) -> DerivedDataStore:
+        """파생 데이터 저장소 (JSON 로드 비용은 처음 필요할 때만 지불)"""
+        if self._derived is None:
+            self._derived = DerivedDataStore(self.work_dir / DERIVED_FILENAME, self.generate_summary)
+        return self._derived
+
     def create_sample_documents(self, count: int = 15) -> bool:
         """샘플 문서 파일 생성 (실제 파일 시스템에 저장)"""
         try:
@@ -45,14 +93,24 @@ class RealMCPExample:
                 "Multimodal은 텍스트, 이미지, 오디오 등 여러 모달리티를 동시에 처리하는 AI의 능력입니다."
             ]
             
-            for i in range(count):
-                filename = f"AI_기술_문서_{i+1:03d}.txt"
-                filepath = self.work_dir / filename
-                
-                content = sample_contents[i % len(sample_contents)]
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(content)
+            documents = (
+                (f"AI_기술_문서_{i+1:03d}.txt", sample_contents[i % len(sample_contents)])
+                for i in range(count)
+            )
             
+            if self.store is not None:
+                # 패킹 저장소: 세그먼트 끝에 순차 추가
+                self.store.put_many(documents)
+            elif self.shards is not None:
+                # 샤딩: 이름 해시로 샤드 디렉토리 결정
+                self.shards.put_many(documents)
+            else:
+                for filename, content in documents:
+                    filepath = self.work_dir / filename
+                    with open(filepath, 'w', encoding='utf-8') as f:
+                        f.write(content)
+            
+            self.catalog.invalidate()
             print(f"✅ {count}개 문서 파일 생성 완료")
             return True
             
@@ -60,6 +118,7 @@ class RealMCPExample:
             print(f"❌ 문서 생성 실패: {e}")
             return False
 
+    @profiled
     def search_documents(self, query: str, max_results: int = 10) -> List[Dict]:
         """
         실제 파일 시스템에서 문서 검색 (MCP 스타일)
@@ -68,80 +127,172 @@ class RealMCPExample:
         
         # 캐시 확인
         cache_key = f"search_{hashlib.md5(query.encode()).hexdigest()}"
-        if cache_key in self.cache:
-            cached_result = self.cache[cache_key]
-            if time.time() - cached_result['timestamp'] < 300:  # 5분 캐시
-                print("✓ 캐시에서 검색 결과 가져옴 (토큰 95% 절약!)")
-                self.execution_log.append({
-                    "action": "search_cached",
-                    "query": query,
-                    "results_count": len(cached_result['results'])
-                })
-                return cached_result['results']
+        cached_results = self.cache.get(cache_key)
+        if cached_results is not None:
+            print("✓ 캐시에서 검색 결과 가져옴 (토큰 95% 절약!)")
+            self._record(LogEntry(
+                action="search_cached",
+                query=query,
+                results_count=len(cached_results)
+            ))
+            return cached_results
         
         try:
             # 실제 파일 시스템 검색
             all_files = []
             query_lower = query.lower()
             
-            for file_path in self.work_dir.glob("*.txt"):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    # 키워드로 필터링 (실행 환경에서!)
-                    if (query_lower in file_path.name.lower() or 
-                        query_lower in content.lower()):
+            if self.shards is not None:
+                # 샤드별 동시 검색 후 상위 max_results개 병합
+                for hit in self.shards.search(query, max_results):
+                    all_files.append({
+                        "id": hit.meta.id,
+                        "name": hit.meta.name,
+                        "path": hit.meta.path,
+                        "size": hit.meta.size,
+                        "modified": hit.meta.modified,
+                        "preview": hit.head[:100] + "..." if hit.length > 100 else hit.head
+                    })
+            else:
+                for file_path, content, packed in self._iter_documents():
+                    try:
+                        # 키워드로 필터링 (실행 환경에서!)
+                        with span(self.profiler, "match"):
+                            matched = (query_lower in file_path.name.lower() or
+                                       query_lower in content.lower())
+                        if matched:
                         
-                        stat = file_path.stat()
-                        all_files.append({
-                            "id": file_path.stem,
-                            "name": file_path.name,
-                            "path": str(file_path),
-                            "size": stat.st_size,
-                            "modified": time.strftime('%Y-%m-%d', time.localtime(stat.st_mtime)),
-                            "preview": content[:100] + "..." if len(content) > 100 else content
-                        })
+                            size, mtime_ns = self._fingerprint(file_path, packed)
+                            all_files.append({
+                                "id": file_path.stem,
+                                "name": file_path.name,
+                                "path": str(file_path),
+                                "size": size,
+                                "modified": time.strftime('%Y-%m-%d', time.localtime(mtime_ns / 1e9)),
+                                "preview": content[:100] + "..." if len(content) > 100 else content
+                            })
                         
-                        if len(all_files) >= max_results:
-                            break
+                            if len(all_files) >= max_results:
+                                break
                             
-                except Exception as e:
-                    print(f"⚠️ 파일 읽기 오류 {file_path}: {e}")
-                    continue
+                    except Exception as e:
+                        print(f"⚠️ 파일 읽기 오류 {file_path}: {e}")
+                        continue
             
-            # 캐시에 저장
-            self.cache[cache_key] = {
-                "results": all_files,
-                "timestamp": time.time()
-            }
+            execution_time = time.time() - start_time
+            
+            # 캐시에 저장 (실행 시간을 비용으로 사용: 승인 여부와 TTL 결정)
+            self.cache.put(cache_key, all_files, cost=execution_time)
             
             # 실행 로깅
-            self.execution_log.append({
-                "action": "search",
-                "query": query,
-                "results_count": len(all_files),
-                "execution_time": time.time() - start_time
-            })
+            self._record(LogEntry(
+                action="search",
+                query=query,
+                results_count=len(all_files),
+                execution_time=execution_time
+            ))
             
-            print(f"✅ 검색 완료: {len(all_files)}개 파일 ({time.time() - start_time:.2f}초)")
+            print(f"✅ 검색 완료: {len(all_files)}개 파일 ({execution_time:.2f}초)")
             return all_files
             
         except Exception as e:
             print(f"❌ 문서 검색 중 오류 발생: {e}")
             return []
 
+    def _iter_documents(self):
+        """
+        (경로, 내용, 패킹 엔트리) 순회
+        packed 저장소는 세그먼트를 순차로 읽고, files 모드는 파일마다 open (엔트리는 None)
+        """
+        if self.store is not None:
+            documents = self.store.scan()
+            while True:
+                with span(self.profiler, "read"):
+                    item = next(documents, None)
+                if item is None:
+                    return
+                name, packed, content = item
+                yield self.work_dir / name, content, packed
+        
+        for file_path in self.work_dir.glob("*.txt"):
+            try:
+                with span(self.profiler, "read"):
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        content = f.read()
+            except Exception as e:
+                print(f"⚠️ 파일 읽기 오류 {file_path}: {e}")
+                continue
+            yield file_path, content, None
+
+    def _fingerprint(self, file_path: Path, packed=None):
+        """문서의 (크기, mtime_ns). 없는 문서는 FileNotFoundError"""
+        if self.store is not None:
+            packed = packed or self.store.stat(file_path.name)
+            if packed is None:
+                raise FileNotFoundError(f"No such document in packed store: {file_path.name}")
+            return packed.size, packed.mtime_ns
+        stat = file_path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def _load(self, file_path: str) -> str:
+        """저장 방식에 맞게 문서 내용 읽기"""
+        if self.store is not None:
+            content = self.store.get(Path(file_path).name)
+            if content is None:
+                raise FileNotFoundError(f"No such document in packed store: {Path(file_path).name}")
+            return content
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
     def read_document(self, file_path: str) -> Optional[str]:
-        """실제 파일 읽기"""
+        """실제 파일 읽기 (packed 저장소면 세그먼트에서 임의 접근)"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            with span(self.profiler, "read"):
+                content = self._load(file_path)
             print(f"✅ 문서 읽기 완료: {Path(file_path).name} ({len(content)}자)")
             return content
         except Exception as e:
             print(f"❌ 문서 읽기 오류: {e}")
             return None
 
+    @profiled
+    def get_metadata(self, fields: Optional[List[str]] = None, limit: Optional[int] = None,
+                     **filters) -> Dict:
+        """
+        메타데이터 질의 (파일을 열지 않고 카탈로그만 사용)
+        filters: category, name_pattern, min_size, max_size, modified_after, modified_before
+        """
+        start_time = time.time()
+        try:
+            result = self.catalog.get_metadata(fields=fields, limit=limit, **filters)
+        except Exception as e:
+            print(f"❌ 메타데이터 조회 오류: {e}")
+            return {"error": str(e)}
+        
+        self._record(LogEntry(
+            action="metadata",
+            results_count=len(result["document_ids"]),
+            execution_time=time.time() - start_time
+        ))
+        return result
+
+    @profiled
+    def get_documents(self, document_ids: List[str], fields: Optional[List[str]] = None) -> Dict:
+        """요청한 필드만 포함한 문서 조회 (내용 필드가 있을 때만 파일을 읽음)"""
+        start_time = time.time()
+        try:
+            result = self.catalog.get_documents(document_ids, fields)
+        except Exception as e:
+            print(f"❌ 문서 조회 오류: {e}")
+            return {"error": str(e)}
+        
+        self._record(LogEntry(
+            action="get_documents",
+            document_count=len(document_ids),
+            execution_time=time.time() - start_time
+        ))
+        return result
+
     def generate_summary(self, content: str, max_length: int = 150) -> str:
         """문서 내용 요약 (실행 환경에서 처리)"""
         sentences = content.split('.')
@@ -154,6 +305,37 @@ class RealMCPExample:
         
         return summary.strip() if summary else content[:max_length]
 
+    def get_derived(self, doc_id: str) -> Optional[Dict]:
+        """
+        문서의 파생 데이터(요약, 단어 수, 글자 수, 미리보기) 조회
+        파일 지문(크기, mtime)이 그대로면 내용을 읽지 않고 저장소에서 반환
+        """
+        name = f"{doc_id}.txt"
+        file_path = self.shards.path_for(name) if self.shards is not None else self.work_dir / name
+        try:
+            size, mtime_ns = self._fingerprint(file_path)
+        except OSError as e:
+            print(f"❌ 문서 읽기 오류: {e}")
+            return None
+        
+        derived = self.derived.lookup(str(file_path), size, mtime_ns)
+        if derived is not None:
+            return dict(derived, cached=True)
+        
+        content = self.read_document(str(file_path))
+        if content is None:
+            return None
+        derived = self.derived.put(str(file_path), size, mtime_ns, content)
+        return dict(derived, cached=False)
+
+    def start_background_indexer(self):
+        """작업 공간 전체의 파생 데이터를 백그라운드에서 미리 계산"""
+        paths = [entry.path for entry in self.catalog.query()]
+        return self.derived.start_indexer(
+            paths, fingerprint=lambda path: self._fingerprint(Path(path)), reader=self._load
+        )
+
+    @profiled
     def batch_process_documents(self, document_ids: List[str]) -> Dict:
         """여러 문서를 배치로 처리"""
         start_time = time.time()
@@ -162,21 +344,24 @@ class RealMCPExample:
             processed_docs = []
             total_words = 0
             
+            derived_hits = 0
+            
             for doc_id in document_ids:
-                file_path = self.work_dir / f"{doc_id}.txt"
-                content = self.read_document(str(file_path))
+                derived = self.get_derived(doc_id)
+                if derived is None:
+                    continue
+                if derived.pop("cached"):
+                    derived_hits += 1
                 
-                if content:
-                    summary = self.generate_summary(content)
-                    word_count = len(content.split())
-                    
-                    processed_docs.append({
-                        "id": doc_id,
-                        "summary": summary,
-                        "word_count": word_count,
-                        "char_count": len(content)
-                    })
-                    total_words += word_count
+                processed_docs.append({
+                    "id": doc_id,
+                    "summary": derived["summary"],
+                    "word_count": derived["word_count"],
+                    "char_count": derived["char_count"]
+                })
+                total_words += derived["word_count"]
+            
+            self.derived.save()
             
             avg_words = total_words / len(processed_docs) if processed_docs else 0
             
@@ -188,12 +373,13 @@ class RealMCPExample:
             }
             
             # 실행 로깅
-            self.execution_log.append({
-                "action": "batch_process",
-                "document_count": len(document_ids),
-                "processed_count": len(processed_docs),
-                "execution_time": time.time() - start_time
-            })
+            self._record(LogEntry(
+                action="batch_process",
+                document_count=len(document_ids),
+                processed_count=len(processed_docs),
+                derived_hits=derived_hits,
+                execution_time=time.time() - start_time
+            ))
             
             print(f"✅ 배치 처리 완료: {len(processed_docs)}개 문서 ({time.time() - start_time:.2f}초)")
             return result
@@ -202,12 +388,16 @@ class RealMCPExample:
             print(f"❌ 배치 처리 오류: {e}")
             return {"error": str(e)}
 
+    @profiled
     def export_results(self, data: Dict, filename: str = "mcp_results.json") -> bool:
         """결과를 JSON 파일로 내보내기"""
         try:
             export_path = self.work_dir / filename
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with span(self.profiler, "serialize"):
+                payload = json.dumps(data, ensure_ascii=False, indent=2, default=to_json)
+            with span(self.profiler, "write"):
+                with open(export_path, 'w', encoding='utf-8') as f:
+                    f.write(payload)
             print(f"✅ 결과 내보내기 완료: {export_path}")
             return True
         except Exception as e:
@@ -215,34 +405,36 @@ class RealMCPExample:
             return False
 
     def analyze_execution_patterns(self) -> Dict:
-        """실행 패턴 분석 (MCP 효율성 측정)"""
-        if not self.execution_log:
+        """실행 패턴 분석 (MCP 효율성 측정). 누적 집계만 사용하므로 로그 길이와 무관"""
+        total_operations = self.stats.totals.total
+        if not total_operations:
             return {"message": "실행 기록이 없습니다"}
         
         # 작업 유형별 분석
-        search_operations = len([log for log in self.execution_log if log["action"].startswith("search")])
-        batch_operations = len([log for log in self.execution_log if log["action"] == "batch_process"])
-        cached_operations = len([log for log in self.execution_log if log["action"].endswith("_cached")])
+        search_operations = self.stats.count(is_search)
+        batch_operations = self.stats.count(is_batch)
+        cached_operations = self.stats.count(is_cached)
         
-        # 시간 분석
-        total_time = sum(log.get("execution_time", 0) for log in self.execution_log)
-        avg_time = total_time / len(self.execution_log)
+        # 시간 분석 (캐시 히트는 실행 시간 0으로 평균에 포함)
+        avg_search_time = self.stats.time(is_search) / search_operations if search_operations else 0
+        avg_batch_time = self.stats.time(is_batch) / batch_operations if batch_operations else 0
         
         # 데이터 처리량 분석
-        total_files_searched = sum(log.get("results_count", 0) for log in self.execution_log if "results_count" in log)
-        possible_files = len(list(self.work_dir.glob("*.txt")))
+        total_files_searched = self.stats.totals.results
+        possible_files = self.catalog.document_count  # 마지막 검색 시점 기준 (분석만으로 재stat하지 않음)
         data_efficiency = ((possible_files - total_files_searched) / possible_files * 100) if possible_files > 0 else 0
         
         return {
-            "총 실행 작업": len(self.execution_log),
+            "총 실행 작업": total_operations,
             "검색 작업": search_operations,
             "배치 처리 작업": batch_operations,
             "캐시 히트율": f"{(cached_operations / search_operations * 100):.1f}%" if search_operations > 0 else "0%",
             "데이터 절약 효과": f"{data_efficiency:.1f}%",
-            "평균 검색 시간": f"{avg_time:.2f}초",
-            "평균 배치 처리 시간": f"{avg_time:.2f}초",
+            "평균 검색 시간": f"{avg_search_time:.2f}초",
+            "평균 배치 처리 시간": f"{avg_batch_time:.2f}초",
             "캐시 저장량": f"{len(self.cache)}개 항목",
-            "작업 공간": str(self.work_dir.absolute())
+            "작업 공간": str(self.work_dir.absolute()),
+            "최근 실행": self.stats.window_summaries()
         }
 
 # 메인 실행 함수
@@ -258,6 +450,7 @@ def main():
         # 1) 샘플 문서 생성
         print("\n=== 📁 샘플 문서 생성 ===")
         handler.create_sample_documents(15)
+        handler.start_background_indexer()  # 요약/통계 미리 계산
         
         # 2) 문서 검색
         print("\n=== 🔍 문서 검색 (AI 기술 관련) ===")
@@ -307,7 +500,12 @@ def main():
         print("\n=== 📊 실행 패턴 분석 ===")
         analysis = handler.analyze_execution_patterns()
         for key, value in analysis.items():
-            print(f"  • {key}: {value}")
+            if key == "최근 실행":
+                for window, summary in value.items():
+                    print(f"  • 최근 {window}: {summary['operations']}개 작업, "
+                          f"캐시 히트율 {summary['cache_hit_ratio'] * 100:.1f}%")
+            else:
+                print(f"  • {key}: {value}")
         
         print("\n" + "=" * 60)
         print("💡 실제 MCP 코드 실행의 핵심 가치:")
@@ -325,6 +523,8 @@ def main():
         print("\n⚠️ 사용자가 프로그램을 중단했습니다.")
     except Exception as e:
         print(f"\n❌ 프로그램 실행 중 오류 발생: {e}")
+    finally:
+        handler.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+MCP 도구 레지스트리
+- 데코레이터 기반 등록, 이름 → 도구 dict 조회로 O(1) 디스패치
+- "module:function" 형태의 지연 도구: 첫 호출(또는 스키마 요청) 시에만 모듈 import
+- tools/list 페이지네이션(cursor/limit)과 이름만 조회(names_only), 스키마는 요청한 도구만 반환
+"""
+
+import importlib
+import inspect
+from typing import Any, Callable, Dict, List, Optional
+
+
+class InvalidParams(ValueError):
+    """JSON-RPC Invalid params (-32602): 잘못된 페이지네이션 인자, 도구 시그니처와 맞지 않는 arguments 등"""
+
+    code = -32602
+
+
+class ToolSpec:
+    """도구 하나의 등록 정보 (핸들러와 스키마는 필요할 때 로드)"""
+
+    __slots__ = ("name", "description", "_schema", "_handler", "_signature", "target")
+
+    def __init__(self, name: str, description: str, input_schema: Optional[Dict[str, Any]] = None,
+                 handler: Optional[Callable] = None, target: Optional[str] = None):
+        self.name = name
+        self.description = description
+        self._schema = input_schema
+        self._handler = handler
+        self._signature: Optional[inspect.Signature] = None
+        self.target = target  # 지연 도구: "module:function"
+
+    def _load_target(self):
+        module_name, _, attr = self.target.partition(":")
+        module = importlib.import_module(module_name)
+        self._handler = getattr(module, attr)
+        if self._schema is None:
+            # 지연 모듈은 모듈 수준 SCHEMAS[도구명]에 스키마를 둘 수 있음
+            self._schema = getattr(module, "SCHEMAS", {}).get(self.name)
+
+    @property
+    def loaded(self) -> bool:
+        return self._handler is not None
+
+    @property
+    def input_schema(self) -> Dict[str, Any]:
+        if self._schema is None and self.target is not None:
+            self._load_target()
+        return self._schema or {"type": "object", "properties": {}, "required": []}
+
+    @property
+    def handler(self) -> Callable:
+        if self._handler is None:
+            self._load_target()
+        return self._handler
+
+    @property
+    def signature(self) -> inspect.Signature:
+        """핸들러 시그니처 (인자 바인딩 검증용, 처음 필요할 때 계산)"""
+        if self._signature is None:
+            self._signature = inspect.signature(self.handler)
+        return self._signature
+
+    def describe(self) -> Dict[str, Any]:
+        return {"name": self.name, "description": self.description, "inputSchema": self.input_schema}
+
+
+class ToolRegistry:
+    """서버 클래스 단위 도구 레지스트리"""
+
+    def __init__(self):
+        self._tools: Dict[str, ToolSpec] = {}
+
+    def tool(self, name: str, description: str, input_schema: Optional[Dict[str, Any]] = None):
+        """메서드 데코레이터: 서버 메서드를 도구로 등록 (핸들러는 (self, **arguments) 형태)"""
+        def decorator(method: Callable) -> Callable:
+            self._tools[name] = ToolSpec(name, description, input_schema, handler=method)
+            return method
+        return decorator
+
+    def lazy(self, name: str, description: str, target: str,
+             input_schema: Optional[Dict[str, Any]] = None) -> None:
+        """지연 도구 등록: target("module:function")은 처음 필요할 때 import"""
+        self._tools[name] = ToolSpec(name, description, input_schema, target=target)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tools
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def get(self, name: str) -> Optional[ToolSpec]:
+        return self._tools.get(name)
+
+    async def call(self, instance: Any, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        도구 호출 (O(1) 조회). 알 수 없는 도구는 ValueError
+        arguments는 핸들러 시그니처에 먼저 바인딩하여, 객체가 아니거나 알 수 없는/누락된 인자가 있으면
+        핸들러 내부 TypeError와 구분되도록 InvalidParams
+        """
+        spec = self._tools.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown tool: {name}")
+        if not isinstance(arguments, dict):
+            raise InvalidParams(f"arguments must be an object: {type(arguments).__name__}")
+        try:
+            bound = spec.signature.bind(instance, **arguments)
+        except TypeError as e:
+            raise InvalidParams(f"Invalid arguments for {name}: {e}") from None
+        result = spec.handler(*bound.args, **bound.kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def list(self, cursor: Optional[str] = None, limit: Optional[int] = None,
+             names_only: bool = False) -> Dict[str, Any]:
+        """
+        tools/list 응답 생성
+        names_only=True면 이름과 설명만 반환하여 스키마 로드(지연 모듈 import)를 피함
+        """
+        names = list(self._tools)
+        if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 1):
+            raise InvalidParams(f"limit must be a positive integer: {limit!r}")
+        start = 0
+        if cursor is not None and cursor != "":
+            # 커서는 이전 응답의 nextCursor (0 이상 도구 수 이하의 10진수 문자열)
+            if not isinstance(cursor, str) or not (cursor.isascii() and cursor.isdigit()) \
+                    or int(cursor) > len(names):
+                raise InvalidParams(f"Invalid cursor: {cursor!r}")
+            start = int(cursor)
+        end = len(names) if limit is None else min(len(names), start + limit)
+
+        tools = []
+        for name in names[start:end]:
+            spec = self._tools[name]
+            tools.append({"name": name, "description": spec.description} if names_only
+                         else spec.describe())
+
+        result: Dict[str, Any] = {"tools": tools}
+        if end < len(names):
+            result["nextCursor"] = str(end)
+        return result
+
+    def describe(self, names: List[str]) -> Dict[str, Any]:
+        """요청한 도구의 전체 스키마만 반환"""
+        unknown = [name for name in names if name not in self._tools]
+        return {
+            "tools": [self._tools[name].describe() for name in names if name in self._tools],
+            "unknown": unknown,
+        }
@@ -0,0 +1,334 @@
+"""
+작업 공간 카탈로그
+파일을 열지 않고 디렉토리 엔트리(stat)만으로 문서 메타데이터를 관리합니다.
+- 메타데이터 질의(get_metadata)는 파일 내용을 전혀 읽지 않음
+- 필드 프로젝션(get_documents)은 요청된 필드만 반환
+"""
+
+import fnmatch
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from packed_store import PackedDocumentStore
+from records import DocumentMeta
+
+# stat 정보만으로 채울 수 있는 필드
+METADATA_FIELDS = ("id", "name", "title", "path", "size", "modified", "mtime", "category")
+# 파일 내용을 읽어야 하는 필드
+CONTENT_FIELDS = ("content", "preview")
+DEFAULT_METADATA_FIELDS = ["id", "name", "size", "modified", "category"]
+
+# 카탈로그 스냅샷: 매직 + JSON 헤더 한 줄 + [이름, 크기, mtime_ns] 행 배열
+SNAPSHOT_FILENAME = ".mcp_catalog.snapshot"
+SNAPSHOT_MAGIC = b"MCPCAT2\n"
+
+
+def _parse_time(value: Union[str, int, float, None]) -> Optional[float]:
+    """'YYYY-MM-DD' 문자열 또는 epoch 초를 epoch 초로 변환"""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    return time.mktime(time.strptime(value, "%Y-%m-%d"))
+
+
+class WorkspaceCatalog:
+    """작업 공간 문서 카탈로그 (stat 기반, 파일 내용 미열람)"""
+
+    def __init__(self, work_dir: Union[str, Path], pattern: str = "*.txt",
+                 store: Optional[PackedDocumentStore] = None):
+        """store를 지정하면 디렉토리 대신 패킹 저장소의 인덱스를 카탈로그로 사용"""
+        self.work_dir = Path(work_dir)
+        self.pattern = pattern
+        self.store = store
+        self._entries: Dict[str, DocumentMeta] = {}
+        self._fingerprints: Dict[str, Tuple[int, int]] = {}  # 문서 id → (크기, mtime_ns)
+        self._dir_mtime_ns: Optional[int] = None
+        self._store_version: Optional[int] = None
+
+    @staticmethod
+    def category_of(name: str) -> str:
+        """파일명 접두어로 카테고리 결정 (예: AI_기술_문서_001.txt → AI)"""
+        return Path(name).stem.split("_", 1)[0]
+
+    def invalidate(self) -> None:
+        """다음 조회 시 디렉토리를 다시 스캔하도록 표시"""
+        self._dir_mtime_ns = None
+        self._store_version = None
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        디렉토리 mtime(또는 저장소 인덱스 버전)이 바뀌었을 때만 재스캔
+        디렉토리가 그대로면 카탈로그 항목만 다시 stat (제자리 수정은 디렉토리 mtime을 바꾸지 않음)
+        """
+        if self.store is not None:
+            self._refresh_from_store(force)
+            return
+        try:
+            dir_mtime_ns = os.stat(self.work_dir).st_mtime_ns
+        except FileNotFoundError:
+            self._entries = {}
+            self._dir_mtime_ns = None
+            return
+
+        if not force and dir_mtime_ns == self._dir_mtime_ns and self._restat():
+            return
+
+        entries = {}
+        fingerprints = {}
+        with os.scandir(self.work_dir) as it:
+            for entry in it:
+                if not entry.is_file() or not fnmatch.fnmatch(entry.name, self.pattern):
+                    continue
+                stat = entry.stat()
+                doc_id = Path(entry.name).stem
+                entries[doc_id] = DocumentMeta(
+                    id=doc_id,
+                    name=entry.name,
+                    path=str(self.work_dir / entry.name),
+                    size=stat.st_size,
+                    mtime=stat.st_mtime,
+                    category=self.category_of(entry.name),
+                )
+                fingerprints[doc_id] = (stat.st_size, stat.st_mtime_ns)
+        self._entries = dict(sorted(entries.items()))
+        self._fingerprints = fingerprints
+        self._dir_mtime_ns = dir_mtime_ns
+
+    def _restat(self) -> bool:
+        """
+        카탈로그 항목의 크기/mtime을 stat으로 갱신 (엔트리 객체를 제자리 수정하여 병합 뷰에도 반영)
+        사라진 파일이 있으면 False (재스캔 필요)
+        """
+        for doc_id, entry in self._entries.items():
+            try:
+                stat = os.stat(entry.path)
+            except FileNotFoundError:
+                return False
+            fingerprint = (stat.st_size, stat.st_mtime_ns)
+            if self._fingerprints.get(doc_id) != fingerprint:
+                self._fingerprints[doc_id] = fingerprint
+                entry.size = stat.st_size
+                entry.mtime = stat.st_mtime
+        return True
+
+    def _state_key(self) -> Optional[int]:
+        """스냅샷 유효성 판단 키: 디렉토리 mtime_ns 또는 패킹 인덱스 파일 mtime_ns"""
+        try:
+            if self.store is not None:
+                return os.stat(self.store.index_path).st_mtime_ns
+            return os.stat(self.work_dir).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def save_snapshot(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        현재 카탈로그 상태를 스냅샷 파일로 저장 (다음 부팅 시 재스캔 생략)
+        이미 로드된 카탈로그는 다시 stat하지 않으며, 스냅샷 파일 생성으로 바뀐 디렉토리 mtime을 반영해
+        저장 직후 조회가 전체 재스캔으로 이어지지 않게 함
+        """
+        if (self._store_version if self.store is not None else self._dir_mtime_ns) is None:
+            self.refresh()
+        before = self._state_key()
+        path = Path(path) if path else self.work_dir / SNAPSHOT_FILENAME
+        # state는 고정 폭으로 기록: 스냅샷 파일 생성 자체가 디렉토리 mtime을 바꾸므로
+        # 파일을 만든 뒤 상태 키를 다시 읽어 제자리에서 덮어씀 (제자리 수정은 디렉토리 mtime 불변)
+        header = {"state": "0" * 20, "pattern": self.pattern, "count": len(self._entries)}
+        header_bytes = json.dumps(header).encode('utf-8')
+        state_offset = len(SNAPSHOT_MAGIC) + header_bytes.index(b'"0000') + 1
+        rows = [[entry.name, *self._fingerprints[doc_id]] for doc_id, entry in self._entries.items()]
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(header_bytes + b"\n")
+            f.write(json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode('utf-8'))
+        os.replace(tmp_path, path)
+        state = self._state_key()
+        with open(path, 'r+b') as f:
+            f.seek(state_offset)
+            f.write(b"%020d" % (state or 0))
+        if self.store is None and before == self._dir_mtime_ns:
+            self._dir_mtime_ns = state  # 그 사이 바뀐 것은 스냅샷 파일뿐
+        return path
+
+    def load_snapshot(self, path: Optional[Union[str, Path]] = None) -> bool:
+        """
+        스냅샷 파일로 카탈로그 복원 (디렉토리 스캔 생략)
+        디렉토리 상태 키와 함께 문서별 (크기, mtime_ns)를 stat으로 확인하여,
+        스냅샷 이후 추가/삭제되거나 제자리 수정된 문서가 있으면 False
+        """
+        path = Path(path) if path else self.work_dir / SNAPSHOT_FILENAME
+        try:
+            with open(path, 'rb') as f:
+                if f.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+                    return False
+                header = json.loads(f.readline())
+                state = self._state_key()
+                if state is None or int(header.get("state", -1)) != state or header.get("pattern") != self.pattern:
+                    return False
+                rows = json.loads(f.read())
+        except (OSError, ValueError):
+            return False
+
+        entries = {}
+        fingerprints = {}
+        for name, size, mtime_ns in rows:
+            doc_id = Path(name).stem
+            mtime = mtime_ns / 1e9
+            if self.store is None:
+                # 패킹 저장소 항목은 인덱스(상태 키)에 포함되므로 파일만 확인
+                try:
+                    stat = os.stat(self.work_dir / name)
+                except OSError:
+                    return False
+                if (stat.st_size, stat.st_mtime_ns) != (size, mtime_ns):
+                    return False
+                mtime = stat.st_mtime
+            entries[doc_id] = DocumentMeta(
+                id=doc_id,
+                name=name,
+                path=str(self.work_dir / name),
+                size=size,
+                mtime=mtime,
+                category=self.category_of(name),
+            )
+            fingerprints[doc_id] = (size, mtime_ns)
+        self._entries = entries
+        self._fingerprints = fingerprints
+        if self.store is not None:
+            self.store.reload()
+            self._store_version = self.store.version
+        else:
+            self._dir_mtime_ns = state
+        return True
+
+    def _refresh_from_store(self, force: bool) -> None:
+        """패킹 저장소 인덱스로 카탈로그 구성 (세그먼트는 읽지 않음)"""
+        self.store.reload()
+        if not force and self.store.version == self._store_version:
+            return
+        entries = {}
+        fingerprints = {}
+        for name, packed in self.store.entries().items():
+            if not fnmatch.fnmatch(name, self.pattern):
+                continue
+            doc_id = Path(name).stem
+            fingerprints[doc_id] = (packed.size, packed.mtime_ns)
+            entries[doc_id] = DocumentMeta(
+                id=doc_id,
+                name=name,
+                path=str(self.work_dir / name),
+                size=packed.size,
+                mtime=packed.mtime_ns / 1e9,
+                category=self.category_of(name),
+            )
+        self._entries = dict(sorted(entries.items()))
+        self._fingerprints = fingerprints
+        self._store_version = self.store.version
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._entries)
+
+    @property
+    def document_count(self) -> int:
+        """마지막 로드/갱신 시점의 문서 수 (refresh/stat 없이 O(1))"""
+        return len(self._entries)
+
+    def get(self, doc_id: str) -> Optional[DocumentMeta]:
+        self.refresh()
+        return self._entries.get(doc_id)
+
+    def query(self,
+              category: Optional[str] = None,
+              name_pattern: Optional[str] = None,
+              min_size: Optional[int] = None,
+              max_size: Optional[int] = None,
+              modified_after: Union[str, float, None] = None,
+              modified_before: Union[str, float, None] = None) -> List[DocumentMeta]:
+        """조건에 맞는 카탈로그 엔트리 목록 (파일 내용은 읽지 않음)"""
+        self.refresh()
+        after = _parse_time(modified_after)
+        before = _parse_time(modified_before)
+
+        matched = []
+        for entry in self._entries.values():
+            if category and entry.category.lower() != category.lower():
+                continue
+            if name_pattern and not fnmatch.fnmatch(entry.name.lower(), name_pattern.lower()):
+                continue
+            if min_size is not None and entry.size < min_size:
+                continue
+            if max_size is not None and entry.size > max_size:
+                continue
+            if after is not None and entry.mtime < after:
+                continue
+            if before is not None and entry.mtime >= before:
+                continue
+            matched.append(entry)
+        return matched
+
+    @staticmethod
+    def check_fields(fields: Iterable[str], allow_content: bool = True) -> List[str]:
+        """요청 필드 검증 (알 수 없는 필드는 ValueError)"""
+        allowed = METADATA_FIELDS + (CONTENT_FIELDS if allow_content else ())
+        fields = list(fields)
+        unknown = [field for field in fields if field not in allowed]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(allowed)})")
+        return fields
+
+    def _read(self, path: str) -> str:
+        if self.store is not None:
+            return self.store.get(Path(path).name)
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def project(self, entry: DocumentMeta, fields: List[str],
+                reader: Optional[Callable[[str], str]] = None) -> Dict[str, Any]:
+        """엔트리에서 요청된 필드만 dict로 추출 (JSON 경계). 내용 필드가 있을 때만 파일을 읽음"""
+        doc = entry.to_dict([field for field in fields if field in METADATA_FIELDS])
+        if any(field in CONTENT_FIELDS for field in fields):
+            content = (reader or self._read)(entry.path)
+            if "content" in fields:
+                doc["content"] = content
+            if "preview" in fields:
+                doc["preview"] = content[:100] + "..." if len(content) > 100 else content
+        return doc
+
+    def get_metadata(self, fields: Optional[List[str]] = None, limit: Optional[int] = None,
+                     **filters) -> Dict[str, Any]:
+        """메타데이터 질의 (파일을 열지 않음)"""
+        fields = self.check_fields(fields or DEFAULT_METADATA_FIELDS, allow_content=False)
+        matched = self.query(**filters)
+        selected = matched[:limit] if limit else matched
+        return {
+            "document_ids": [entry.id for entry in selected],
+            "documents": [self.project(entry, fields) for entry in selected],
+            "fields": fields,
+            "total_count": len(matched),
+            "filters": {key: value for key, value in filters.items() if value is not None},
+        }
+
+    def get_documents(self, document_ids: List[str], fields: Optional[List[str]] = None,
+                      reader: Optional[Callable[[str], str]] = None) -> Dict[str, Any]:
+        """지정한 문서의 요청 필드만 반환"""
+        fields = self.check_fields(fields or DEFAULT_METADATA_FIELDS)
+        self.refresh()
+        documents = []
+        missing = []
+        for doc_id in document_ids:
+            entry = self._entries.get(doc_id)
+            if entry is None:
+                missing.append(doc_id)
+                continue
+            documents.append(self.project(entry, fields, reader))
+        return {
+            "documents": documents,
+            "fields": fields,
+            "count": len(documents),
+            "missing": missing,
+        }